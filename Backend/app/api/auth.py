@@ -1,22 +1,55 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from app.api.deps import CurrentUser, Db
+from app.api.deps import CurrentUser, UserRepo, invalidate_user
 from app.domain.models import User
-from app.repositories.users import UserRepository
 from app.security.jwt import create_access_token
 from app.services.otp import generate_secret, provisioning_uri_from_secret, verify_totp_secret
-from app.security.passwords import verify_password, hash_password, needs_rehash
+from app.security.passwords import hash_password, hash_password_async, needs_rehash, verify_password_async
 
 logger = logging.getLogger(__name__)
 
 router: APIRouter = APIRouter(prefix="/auth", tags=["auth"])
 
+# Compiled once at import; used instead of a per-field `pattern=` constraint.
+# `re.ASCII` keeps the character classes from expanding to Unicode.
+_USERNAME_RE: re.Pattern[str] = re.compile(r"\A[A-Za-z0-9]+\Z", re.ASCII)
+
+# Verified against when the username is unknown so that response time does not reveal
+# whether an account exists. Computed once with the configured parameters.
+_DUMMY_HASH: str = hash_password("__unused__")
+
+_MODEL_CONFIG: ConfigDict = ConfigDict(
+    frozen=True,
+    extra="forbid",
+    str_strip_whitespace=False,
+    validate_default=False,
+)
+
+
+def _validate_username(value: str) -> str:
+    """Validate that a username is alphanumeric.
+
+    Args:
+        value: Raw username.
+
+    Returns:
+        str: The same username.
+
+    Raises:
+        ValueError: If the username contains non-alphanumeric characters.
+    """
+    if _USERNAME_RE.match(value) is None:
+        raise ValueError("username must be alphanumeric")
+    return value
+
 
 class LoginIn(BaseModel):
     """Request body for password-based login.
@@ -26,26 +59,46 @@ class LoginIn(BaseModel):
         password: Plaintext password.
     """
 
-    username: str = Field(min_length=1, pattern=r"^[A-Za-z0-9]+$")
+    model_config = _MODEL_CONFIG
+
+    username: str = Field(min_length=1)
     password: str = Field(default="", min_length=1, description="Plaintext password")
 
+    @field_validator("username")
+    @classmethod
+    def _check_username(cls, value: str) -> str:
+        """Validate username characters."""
+        return _validate_username(value)
+
 
 class OtpProvisionOut(BaseModel):
     """Response model containing an otpauth provisioning URI."""
 
+    model_config = _MODEL_CONFIG
+
     otpauth_uri: str
 
 
 class OtpLoginIn(BaseModel):
     """Request body for OTP (TOTP) login."""
 
-    username: str = Field(min_length=1, pattern=r"^[A-Za-z0-9]+$")
+    model_config = _MODEL_CONFIG
+
+    username: str = Field(min_length=1)
     otp: str = Field(min_length=4, max_length=12)
 
+    @field_validator("username")
+    @classmethod
+    def _check_username(cls, value: str) -> str:
+        """Validate username characters."""
+        return _validate_username(value)
+
 
 class TokenOut(BaseModel):
     """JWT token response returned after successful authentication."""
 
+    model_config = _MODEL_CONFIG
+
     access_token: str
     token_type: str = "bearer"
     user_id: UUID
@@ -53,12 +106,12 @@ class TokenOut(BaseModel):
 
 
 @router.post("/login", response_model=TokenOut)
-async def login(payload: LoginIn, db: Db) -> TokenOut:
+async def login(payload: LoginIn, repo: UserRepo) -> TokenOut:
     """Authenticate a user and return a JWT access token.
 
     Args:
         payload: Login payload.
-        db: MongoDB database dependency.
+        repo: User repository dependency.
 
     Returns:
         TokenOut: Access token and basic user info.
@@ -67,58 +120,73 @@ async def login(payload: LoginIn, db: Db) -> TokenOut:
         HTTPException: If credentials are invalid or payload is incomplete.
     """
 
-    repo: UserRepository = UserRepository(db)
+    # `password` defaults to "" and defaults are not validated; reject before any DB work.
+    if not payload.password:
+        raise HTTPException(status_code=422, detail="Missing credentials")
+
     user = await repo.get_by_name(payload.username)
     if user is None:
+        # Burn the same Argon2 cost as a real verify to keep timing flat for unknown users.
+        await verify_password_async(payload.password, _DUMMY_HASH)
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    if not verify_password(payload.password, user.password_hash):
+    # Argon2 is CPU-bound; run it on the executor so the event loop keeps serving requests.
+    if not await verify_password_async(payload.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     if needs_rehash(user.password_hash):
         try:
-            await repo.update_password_hash(user_id=user.id, password_hash=hash_password(payload.password))
+            new_hash: str = await hash_password_async(payload.password)
+            await repo.update_password_hash(user_id=user.id, password_hash=new_hash)
+            invalidate_user(user.id)
         except Exception:
             pass
 
     token: str = create_access_token(user_id=user.id, role=user.role)
-    logger.info("User logged in", extra={"user_id": str(user.id), "role": user.role.value})
+    # Guard so the extra dict and str(UUID) are only built when INFO is actually emitted.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("User logged in", extra={"user_id": str(user.id), "role": user.role.value})
 
     return TokenOut(access_token=token, user_id=user.id, role=user.role.value)
 
 
 @router.post("/otp/enable", response_model=OtpProvisionOut)
-async def otp_enable(db: Db, current_user: CurrentUser) -> OtpProvisionOut:
+async def otp_enable(repo: UserRepo, current_user: CurrentUser) -> OtpProvisionOut:
     """Enable OTP (TOTP) for the currently authenticated user.
 
     This endpoint requires a valid JWT (password login first). It stores a new
-    per-user TOTP secret and returns an otpauth provisioning URI.
+    per-user TOTP secret and returns an otpauth provisioning URI. If OTP is
+    already enabled, the existing secret is reused (no write, no rotation).
 
     Args:
-        db: MongoDB database dependency.
+        repo: User repository dependency.
         current_user: Authenticated user.
 
     Returns:
         OtpProvisionOut: Provisioning URI.
     """
 
-    repo: UserRepository = UserRepository(db)
+    existing: str | None = getattr(current_user, "otp_secret", None)
+    if getattr(current_user, "otp_enabled", False) and existing:
+        uri: str = provisioning_uri_from_secret(secret=existing, username=current_user.name)
+        return OtpProvisionOut(otpauth_uri=uri)
 
     secret: str = generate_secret()
     await repo.enable_otp(user_id=current_user.id, otp_secret=secret)
+    invalidate_user(current_user.id)
 
-    uri: str = provisioning_uri_from_secret(secret=secret, username=current_user.name)
+    uri = provisioning_uri_from_secret(secret=secret, username=current_user.name)
     logger.info("OTP enabled", extra={"user_id": str(current_user.id)})
     return OtpProvisionOut(otpauth_uri=uri)
 
 
 @router.post("/otp/login", response_model=TokenOut)
-async def otp_login(payload: OtpLoginIn, db: Db) -> TokenOut:
+async def otp_login(payload: OtpLoginIn, repo: UserRepo) -> TokenOut:
     """Authenticate using OTP (TOTP) and return a JWT token.
 
     Args:
         payload: OTP login payload.
-        db: MongoDB database dependency.
+        repo: User repository dependency.
 
     Returns:
         TokenOut: Access token and basic user info.
@@ -127,7 +195,6 @@ async def otp_login(payload: OtpLoginIn, db: Db) -> TokenOut:
         HTTPException: If credentials are invalid.
     """
 
-    repo: UserRepository = UserRepository(db)
     user: User | None = await repo.get_by_name(payload.username)
     if user is None:
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -135,10 +202,11 @@ async def otp_login(payload: OtpLoginIn, db: Db) -> TokenOut:
     if not getattr(user, "otp_enabled", False) or not getattr(user, "otp_secret", None):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    if not verify_totp_secret(secret=str(user.otp_secret), code=payload.otp):
+    if not await asyncio.to_thread(verify_totp_secret, secret=str(user.otp_secret), code=payload.otp):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     token = create_access_token(user_id=user.id, role=user.role)
-    logger.info("User OTP logged in", extra={"user_id": str(user.id), "role": user.role.value})
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("User OTP logged in", extra={"user_id": str(user.id), "role": user.role.value})
 
     return TokenOut(access_token=token, user_id=user.id, role=user.role.value)
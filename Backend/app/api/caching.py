@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import re
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an `If-None-Match` header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw header value.
+        etag: Current ETag.
+
+    Returns:
+        bool: True if the client copy is still current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque: str = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def if_range_matches(if_range: str, etag: str) -> bool:
+    """Check an `If-Range` header against an ETag (strong comparison, RFC 9110 13.1.5).
+
+    Weak tags never match, and neither does an HTTP-date (no Last-Modified is sent).
+
+    Args:
+        if_range: Raw header value.
+        etag: Current ETag.
+
+    Returns:
+        bool: True if the requested range may be served.
+    """
+    tag: str = if_range.strip()
+    return not tag.startswith("W/") and not etag.startswith("W/") and tag == etag
+
+
+_RANGE_RE: re.Pattern[str] = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def parse_byte_range(range_header: str | None, length: int) -> tuple[int, int] | None:
+    """Parse a single-range `Range` header against a resource length.
+
+    Multi-range and malformed headers are ignored (the full resource is served),
+    as RFC 9110 allows.
+
+    Args:
+        range_header: Raw header value.
+        length: Resource length in bytes.
+
+    Returns:
+        tuple[int, int] | None: Inclusive (start, end) byte positions, or None to
+        serve the full resource.
+
+    Raises:
+        ValueError: If the range is syntactically valid but not satisfiable.
+    """
+    if not range_header:
+        return None
+    m: re.Match[str] | None = _RANGE_RE.fullmatch(range_header.strip())
+    if m is None or m.group(1) == m.group(2) == "":
+        return None
+
+    first, last = m.group(1), m.group(2)
+    if first == "":
+        # Suffix range: the last N bytes.
+        suffix: int = int(last)
+        if suffix == 0 or length == 0:
+            raise ValueError("Unsatisfiable range")
+        return max(length - suffix, 0), length - 1
+
+    start: int = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= length:
+        raise ValueError("Unsatisfiable range")
+    end: int = min(int(last), length - 1) if last else length - 1
+    return start, end
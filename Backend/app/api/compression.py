@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# File downloads: their Content-Length and byte ranges refer to the stored bytes, so
+# they must be sent as-is.
+FILE_DOWNLOAD_PATHS: re.Pattern[str] = re.compile(r"^/projects/[^/]+/(?:original|translated)$")
+
+
+class SelectiveGZipMiddleware:
+    """`GZipMiddleware` that passes requests to excluded paths through uncompressed.
+
+    Args:
+        app: Wrapped ASGI application.
+        exclude_paths: Pattern matched against the request path; matches skip gzip.
+        **gzip_options: Passed to `GZipMiddleware` (e.g. `minimum_size`).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        /,
+        *,
+        exclude_paths: re.Pattern[str],
+        **gzip_options: Any,
+    ) -> None:
+        """Initialize the middleware."""
+        self._app: ASGIApp = app
+        self._gzip: GZipMiddleware = GZipMiddleware(app, **gzip_options)
+        self._exclude_paths: re.Pattern[str] = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Dispatch to the plain app for excluded paths, to gzip otherwise."""
+        if scope["type"] == "http" and self._exclude_paths.match(scope["path"]):
+            await self._app(scope, receive, send)
+            return
+        await self._gzip(scope, receive, send)
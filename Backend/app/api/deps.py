@@ -1,44 +1,301 @@
 from __future__ import annotations
 
-from typing import Any, Annotated, AsyncIterator, Optional
+import hashlib
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Annotated, Callable, Optional, TypeVar
 
 import jwt
-from fastapi import Depends, HTTPException
+from cachetools import TLRUCache
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from uuid import UUID
 
+from app.db.gridfs import GridFsService
 from app.db.mongo import get_db
 from app.domain.models import User
+from app.repositories.feedback import FeedbackRepository
+from app.repositories.projects import ProjectRepository
+from app.repositories.translator_languages import TranslatorLanguageRepository
 from app.repositories.users import UserRepository
 from app.security.jwt import decode_token
+from app.services.emailer import EmailService
+from app.services.project_review import ProjectReviewService
+from app.services.project_service import ProjectService
 
+_T = TypeVar("_T")
 
-async def db_dep() -> AsyncIterator[AsyncIOMotorDatabase[Any]]:
-    """FastAPI dependency that yields a MongoDB database handle.
+# `app.state` attribute names populated by `_shared`, so shutdown can drop them.
+_shared_names: set[str] = set()
 
-    Yields:
+
+async def db_dep() -> AsyncIOMotorDatabase[Any]:
+    """FastAPI dependency returning the process-wide MongoDB database handle.
+
+    A plain coroutine (no generator) since there is nothing to tear down per request;
+    `get_db()` memoizes the handle in a module global.
+
+    Returns:
         AsyncIOMotorDatabase: Database handle.
     """
-    yield get_db()
+    return get_db()
 
 
 Db: type(AsyncIOMotorDatabase) = Annotated[AsyncIOMotorDatabase[Any], Depends(db_dep)]
 
+
+def _shared(request: Request, name: str, factory: Callable[[], _T]) -> _T:
+    """Return an app-wide instance stored on `app.state`, creating it on first use.
+
+    Repositories and services are stateless wrappers around the shared database
+    handle, so one instance per application is reused by all requests.
+
+    Args:
+        request: Current request.
+        name: Attribute name on `app.state`.
+        factory: Builds the instance if it does not exist yet.
+
+    Returns:
+        The shared instance.
+    """
+    state: Any = request.app.state
+    obj: _T | None = getattr(state, name, None)
+    if obj is None:
+        obj = factory()
+        setattr(state, name, obj)
+        _shared_names.add(name)
+    return obj
+
+
+def clear_shared(app: FastAPI) -> None:
+    """Drop all instances cached by `_shared` from `app.state`.
+
+    Called on shutdown: the cached repositories and services hold the database
+    handle of the client being closed, so a later lifespan must rebuild them.
+
+    Args:
+        app: FastAPI application.
+    """
+    for name in _shared_names:
+        if hasattr(app.state, name):
+            delattr(app.state, name)
+
+
+async def user_repo_dep(request: Request, db: Db) -> UserRepository:
+    """FastAPI dependency providing the shared `UserRepository`.
+
+    Args:
+        request: Current request.
+        db: MongoDB database handle.
+
+    Returns:
+        UserRepository: Repository bound to the database.
+    """
+    return _shared(request, "user_repo", lambda: UserRepository(db))
+
+
+async def project_repo_dep(request: Request, db: Db) -> ProjectRepository:
+    """FastAPI dependency providing the shared `ProjectRepository`.
+
+    Args:
+        request: Current request.
+        db: MongoDB database handle.
+
+    Returns:
+        ProjectRepository: Repository bound to the database.
+    """
+    return _shared(request, "project_repo", lambda: ProjectRepository(db))
+
+
+async def feedback_repo_dep(request: Request, db: Db) -> FeedbackRepository:
+    """FastAPI dependency providing the shared `FeedbackRepository`.
+
+    Args:
+        request: Current request.
+        db: MongoDB database handle.
+
+    Returns:
+        FeedbackRepository: Repository bound to the database.
+    """
+    return _shared(request, "feedback_repo", lambda: FeedbackRepository(db))
+
+
+async def translator_lang_repo_dep(request: Request, db: Db) -> TranslatorLanguageRepository:
+    """FastAPI dependency providing the shared `TranslatorLanguageRepository`.
+
+    Args:
+        request: Current request.
+        db: MongoDB database handle.
+
+    Returns:
+        TranslatorLanguageRepository: Repository bound to the database.
+    """
+    return _shared(request, "translator_lang_repo", lambda: TranslatorLanguageRepository(db))
+
+
+async def gridfs_dep(request: Request, db: Db) -> GridFsService:
+    """FastAPI dependency providing the shared `GridFsService`.
+
+    Args:
+        request: Current request.
+        db: MongoDB database handle.
+
+    Returns:
+        GridFsService: GridFS wrapper bound to the database.
+    """
+    return _shared(request, "gridfs", lambda: GridFsService(db))
+
+
+async def mailer_dep(request: Request) -> EmailService:
+    """FastAPI dependency providing the shared `EmailService`.
+
+    Args:
+        request: Current request.
+
+    Returns:
+        EmailService: Email sender (keeps its SMTP connection between requests).
+    """
+    return _shared(request, "mailer", EmailService)
+
+
+UserRepo = Annotated[UserRepository, Depends(user_repo_dep)]
+ProjectRepo = Annotated[ProjectRepository, Depends(project_repo_dep)]
+FeedbackRepo = Annotated[FeedbackRepository, Depends(feedback_repo_dep)]
+TranslatorLangRepo = Annotated[
+    TranslatorLanguageRepository, Depends(translator_lang_repo_dep)
+]
+GridFs = Annotated[GridFsService, Depends(gridfs_dep)]
+Mailer = Annotated[EmailService, Depends(mailer_dep)]
+
+
+async def project_service_dep(
+    request: Request,
+    project_repo: ProjectRepo,
+    translator_lang_repo: TranslatorLangRepo,
+    user_repo: UserRepo,
+    fs: GridFs,
+    mailer: Mailer,
+) -> ProjectService:
+    """FastAPI dependency providing the shared `ProjectService`.
+
+    Args:
+        request: Current request.
+        project_repo: Project repository.
+        translator_lang_repo: TranslatorLanguage repository.
+        user_repo: User repository.
+        fs: GridFS helper.
+        mailer: Email service.
+
+    Returns:
+        ProjectService: Service bound to the shared repositories.
+    """
+    return _shared(
+        request,
+        "project_service",
+        lambda: ProjectService(
+            project_repo=project_repo,
+            translator_lang_repo=translator_lang_repo,
+            user_repo=user_repo,
+            gridfs=fs,
+            mailer=mailer,
+        ),
+    )
+
+
+async def review_service_dep(
+    request: Request, project_repo: ProjectRepo, feedback_repo: FeedbackRepo
+) -> ProjectReviewService:
+    """FastAPI dependency providing the shared `ProjectReviewService`.
+
+    Args:
+        request: Current request.
+        project_repo: Project repository.
+        feedback_repo: Feedback repository.
+
+    Returns:
+        ProjectReviewService: Service bound to the shared repositories.
+    """
+    return _shared(request, "review_service", lambda: ProjectReviewService(project_repo, feedback_repo))
+
+
+ProjectSvc = Annotated[ProjectService, Depends(project_service_dep)]
+ReviewSvc = Annotated[ProjectReviewService, Depends(review_service_dep)]
+
 _security = HTTPBearer(auto_error=False)
 
+# Upper bound for how long a resolved user is served from the token cache.
+_TOKEN_CACHE_MAX_TTL_SECONDS: int = 60
+
+
+@dataclass(frozen=True, slots=True)
+class DecodedToken:
+    """Token cache entry holding the decoded claims and the resolved user.
+
+    Attributes:
+        user_id: Parsed `sub` claim.
+        role: `role` claim.
+        exp: Token expiration (UNIX timestamp).
+        user: Resolved user.
+    """
+
+    user_id: UUID
+    role: str
+    exp: float
+    user: User
+
+
+# Maps sha256(bearer token) -> decoded token. Entries expire at min(token exp, now + 60 s).
+_token_cache: TLRUCache[bytes, DecodedToken] = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _key, value, now: min(value.exp, now + _TOKEN_CACHE_MAX_TTL_SECONDS),
+    timer=time.time,
+)
+
+
+@lru_cache(maxsize=4096)
+def _uuid_from_sub(sub: str) -> UUID:
+    """Parse the `sub` claim into a UUID (memoized).
+
+    Args:
+        sub: Subject claim.
+
+    Returns:
+        UUID: Parsed user id.
+
+    Raises:
+        ValueError: If `sub` is not a valid UUID.
+    """
+    return UUID(sub)
+
+
+def invalidate_user(user_id: UUID) -> None:
+    """Drop all cached token entries resolving to the given user.
+
+    Call this after the stored user document changes (password rehash, OTP enable)
+    so subsequent requests see the fresh user.
+
+    Args:
+        user_id: User UUID.
+    """
+    for key, entry in list(_token_cache.items()):
+        if entry.user.id == user_id:
+            _token_cache.pop(key, None)
+
 
 async def current_user_dep(
     creds: Optional[HTTPAuthorizationCredentials] = Depends(_security),
-    db: AsyncIOMotorDatabase[Any] = Depends(db_dep),
+    repo: UserRepository = Depends(user_repo_dep),
 ) -> User:
     """FastAPI dependency that resolves the currently authenticated user.
 
     The user is resolved by decoding a JWT token from the `Authorization: Bearer` header.
+    Resolved users are cached per token for at most 60 seconds (never past token expiry).
 
     Args:
         creds: Parsed HTTP bearer credentials.
-        db: MongoDB database handle.
+        repo: User repository.
 
     Returns:
         User: Authenticated user.
@@ -49,17 +306,32 @@ async def current_user_dep(
     if creds is None:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
+    key: bytes = hashlib.sha256(creds.credentials.encode("utf-8")).digest()
+    cached: DecodedToken | None = _token_cache.get(key)
+    if cached is not None and cached.exp > time.time():
+        return cached.user
+
     try:
         payload: dict[str, Any] = decode_token(creds.credentials)
-        user_id: UUID = UUID(payload.get("sub"))
-    except (jwt.PyJWTError, ValueError, TypeError):
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    sub: Any = payload.get("sub")
+    if not isinstance(sub, str):
+        raise HTTPException(status_code=401, detail="Invalid token")
+    try:
+        user_id: UUID = _uuid_from_sub(sub)
+    except ValueError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    repo: UserRepository = UserRepository(db)
     user: User | None = await repo.get_by_id(user_id)
     if user is None:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    exp: Any = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _token_cache[key] = DecodedToken(user_id=user_id, role=str(payload.get("role", "")), exp=float(exp), user=user)
+
     return user
 
 
@@ -1,59 +1,98 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import hashlib
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 
-from app.api.deps import CurrentUser, Db
+from app.api.caching import etag_matches
+from app.api.deps import CurrentUser, ProjectRepo
 from app.domain.enums import UserRole
 from app.domain.models import Project, Feedback
-from app.repositories.feedback import FeedbackRepository
-from app.repositories.projects import ProjectRepository
 
 router: APIRouter = APIRouter(prefix="/feedback", tags=["feedback"])
 
+# Feedback is per-user data; let the browser (but no shared cache) reuse it briefly.
+_CACHE_CONTROL: str = "private, max-age=30"
+
 
 class FeedbackOut(BaseModel):
     """Feedback response model."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=False, validate_default=False)
+
     project_id: UUID
     text: str
-    created_at: str
+    created_at: datetime
+
+
+def _feedback_etag(feedback: Feedback) -> str:
+    """Build a weak ETag identifying a feedback revision.
+
+    Args:
+        feedback: Feedback entity.
+
+    Returns:
+        str: Weak ETag value (e.g. `W/"3f2a..."`).
+    """
+    digest: str = hashlib.blake2b(
+        f"{feedback.id}|{feedback.created_at.timestamp()}|{feedback.text}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    return f'W/"{digest}"'
 
 
 @router.get("/projects/{project_id}", response_model=FeedbackOut)
-async def get_feedback_by_project(project_id: UUID, db: Db, current_user: CurrentUser) -> FeedbackOut:
+async def get_feedback_by_project(
+    project_id: UUID,
+    request: Request,
+    response: Response,
+    proj_repo: ProjectRepo,
+    current_user: CurrentUser,
+) -> FeedbackOut | Response:
     """Get feedback for a project.
 
     Access rules:
         - CUSTOMER: only own project
         - TRANSLATOR: only assigned project
 
+    Responses carry a weak `ETag` and `Cache-Control: private, max-age=30`. A request
+    whose `If-None-Match` matches the current ETag gets an empty 304.
+
     Args:
         project_id: Project UUID.
-        db: MongoDB database dependency.
+        request: Incoming request (for `If-None-Match`).
+        response: Outgoing response (for caching headers).
+        proj_repo: Project repository dependency.
         current_user: Authenticated user.
 
     Returns:
-        FeedbackOut: Feedback for the project.
+        FeedbackOut | Response: Feedback for the project, or 304 Not Modified.
 
     Raises:
         HTTPException: If project/feedback is not found or access is denied.
     """
 
-    proj_repo: ProjectRepository = ProjectRepository(db)
-    project: Project | None = await proj_repo.get_by_id(project_id)
-    if project is None:
+    row: tuple[Project, Feedback | None] | None = await proj_repo.get_with_feedback(project_id)
+    if row is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
+    project, feedback = row
+
     if current_user.role == UserRole.CUSTOMER and project.customer_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not allowed")
     if current_user.role == UserRole.TRANSLATOR and project.translator_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not allowed")
 
-    repo: FeedbackRepository = FeedbackRepository(db)
-    feedback: Feedback | None = await repo.get_by_project_id(project_id)
     if feedback is None:
         raise HTTPException(status_code=404, detail="Feedback not found")
 
-    return FeedbackOut(project_id=feedback.project_id, text=feedback.text, created_at=feedback.created_at.isoformat())
+    etag: str = _feedback_etag(feedback)
+    headers: dict[str, str] = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return FeedbackOut(project_id=feedback.project_id, text=feedback.text, created_at=feedback.created_at)
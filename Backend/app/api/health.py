@@ -1,20 +1,48 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
 from fastapi import APIRouter
 
 from app.db.mongo import ping_db
 
 router = APIRouter(prefix="/health", tags=["health"])
 
+# A successful ping is reused for this long so probe storms hit MongoDB at most once per window.
+_CACHE_SECONDS: float = 2.0
+
+_last_ok: float = 0.0
+_last_result: bool = False
+_lock: asyncio.Lock = asyncio.Lock()
+
+
+def _cached_ok() -> bool:
+    """Return True if a recent successful ping can be reused."""
+    return _last_result and time.monotonic() - _last_ok < _CACHE_SECONDS
+
 
 @router.get("")
 async def health() -> dict[str, str]:
     """Health check endpoint.
 
-    Performs a MongoDB ping.
+    Performs a MongoDB ping. Successful results are cached for a short window and
+    concurrent probes share a single in-flight ping.
 
     Returns:
         dict[str, str]: {"status": "ok"|"fail"}
     """
-    ok: bool = await ping_db()
+    global _last_ok, _last_result
+
+    if _cached_ok():
+        return {"status": "ok"}
+
+    async with _lock:
+        if _cached_ok():
+            return {"status": "ok"}
+
+        ok: bool = await ping_db()
+        _last_result = ok
+        _last_ok = time.monotonic()
+
     return {"status": "ok" if ok else "fail"}
@@ -1,27 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Optional, Mapping
+from datetime import datetime
+from typing import Annotated, Any, Optional, Mapping
 from uuid import UUID
 
 from bson import ObjectId
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
-from fastapi.responses import Response
-from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCursor
-from pydantic import BaseModel, Field
-
-from app.api.deps import CurrentUser, Db
+from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import Response, StreamingResponse
+from motor.motor_asyncio import AsyncIOMotorGridOut
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.api.caching import etag_matches, if_range_matches, parse_byte_range
+from app.api.deps import (
+    CurrentUser,
+    GridFs,
+    Mailer,
+    ProjectRepo,
+    ProjectSvc,
+    ReviewSvc,
+    UserRepo,
+)
 from app.core.config import settings
-from app.db.gridfs import GridFsService
+from app.db.gridfs import GridFsService, UploadTooLargeError, iter_chunks
 from app.domain.enums import UserRole
-from app.domain.models import Project, User, Feedback
-from app.repositories.feedback import FeedbackRepository
-from app.repositories.projects import ProjectRepository
-from app.repositories.translator_languages import TranslatorLanguageRepository
-from app.repositories.users import UserRepository
-from app.services.emailer import EmailService
-from app.services.project_review import ProjectReviewService, ReviewResult
-from app.services.project_service import ProjectService, CreateProjectResult
+from app.domain.models import LanguageCode, Project, User
+from app.services.project_review import ReviewResult
+from app.services.project_service import CreateProjectResult
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +37,8 @@ router: APIRouter = APIRouter(prefix="/projects", tags=["projects"])
 class ProjectOut(BaseModel):
     """Short project representation used by create endpoint."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     customer_id: UUID
     translator_id: Optional[UUID] = None
@@ -41,6 +49,8 @@ class ProjectOut(BaseModel):
 class ProjectListItemOut(BaseModel):
     """Project list row returned to CUSTOMER/TRANSLATOR UI."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     language_code: str
     original_file_name: str | None = None
@@ -57,6 +67,8 @@ class ProjectListItemOut(BaseModel):
 class AdminFeedbackProjectOut(BaseModel):
     """Project row used in the admin feedback view."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     language_code: str
     state: str
@@ -70,38 +82,110 @@ class AdminFeedbackProjectOut(BaseModel):
     created_at: str | None = None
 
 
-async def _map_gridfs_filenames(db: AsyncIOMotorDatabase[Any], file_ids: list[str]) -> dict[str, str]:
-    """Batch map GridFS file ids to filenames.
+async def _none() -> None:
+    """Awaitable placeholder for an optional lookup in `asyncio.gather`."""
+    return None
+
+
+# Stored files never change for a given GridFS id; translated files can be replaced
+# under the same URL, so those are always revalidated.
+_ORIGINAL_CACHE_CONTROL: str = "private, max-age=3600"
+_TRANSLATED_CACHE_CONTROL: str = "private, no-cache"
+
+
+def _iso_or_none(value: str | datetime | None) -> str | None:
+    """Format a stored creation timestamp the same way as ``Project.created_at_iso``.
 
     Args:
-        db: MongoDB database handle.
-        file_ids: GridFS ObjectId values stored as strings.
+        value: Stored timestamp, either an ISO string (``...Z``) or a datetime.
 
     Returns:
-        dict[str, str]: Mapping {file_id: filename}.
+        str | None: ISO 8601 string (``+00:00`` offset), or None if missing.
     """
+    if value is None:
+        return None
+    parsed: datetime = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    return parsed.isoformat()
 
-    oids: list[ObjectId] = []
-    for fid in file_ids:
-        try:
-            oids.append(ObjectId(fid))
-        except Exception:
-            continue
 
-    if not oids:
-        return {}
+async def _stream_file(
+    request: Request,
+    fs: GridFsService,
+    oid: ObjectId,
+    default_filename: str,
+    cache_control: str,
+) -> Response:
+    """Build a download response streaming a GridFS file chunk by chunk.
 
-    cursor: AsyncIOMotorCursor[Mapping[str, Any]]  = db["files.files"].find({"_id": {"$in": oids}}, projection={"filename": 1})
-    docs: list[Mapping[str, Any]] = await cursor.to_list(length=len(oids))
-    return {str(d["_id"]): d.get("filename") for d in docs if d.get("filename")}
+    GridFS files are immutable, so the file id serves as a strong ETag. A matching
+    `If-None-Match` is answered with 304 without touching GridFS. A single
+    `Range` request is answered with 206 by seeking inside the GridFS file, so
+    interrupted downloads can resume; `If-Range` with a stale validator gets the
+    full file.
+
+    Args:
+        request: Incoming request (for conditional and range headers).
+        fs: GridFS service.
+        oid: GridFS ObjectId.
+        default_filename: Filename used when the stored file has none.
+        cache_control: `Cache-Control` header value.
+
+    Returns:
+        Response: Attachment response (200 or 206) with Content-Length set, or 304 Not Modified.
+
+    Raises:
+        HTTPException: 416 if the requested range is not satisfiable.
+    """
+    etag: str = f'"{oid}"'
+    cache_headers: dict[str, str] = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    stream: AsyncIOMotorGridOut = await fs.open_download_stream(oid)
+
+    metadata: Mapping[str, Any] = stream.metadata or {}
+    content_type: str = metadata.get("content_type") or "application/octet-stream"
+    filename: str = stream.filename or default_filename
+    length: int = stream.length
+
+    headers: dict[str, str] = {
+        "Content-Disposition": f"attachment; filename=\"{filename}\"",
+        "Accept-Ranges": "bytes",
+        **cache_headers,
+    }
+
+    if_range: str | None = request.headers.get("if-range")
+    try:
+        byte_range: tuple[int, int] | None = (
+            parse_byte_range(request.headers.get("range"), length)
+            if if_range is None or if_range_matches(if_range, etag)
+            else None
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=416, detail="Requested range not satisfiable", headers={"Content-Range": f"bytes */{length}"}
+        )
+
+    if byte_range is None:
+        headers["Content-Length"] = str(length)
+        return StreamingResponse(iter_chunks(stream), media_type=content_type, headers=headers)
+
+    start, end = byte_range
+    stream.seek(start)
+    headers["Content-Length"] = str(end - start + 1)
+    headers["Content-Range"] = f"bytes {start}-{end}/{length}"
+    return StreamingResponse(
+        iter_chunks(stream, end - start + 1), status_code=206, media_type=content_type, headers=headers
+    )
 
 
 @router.post("", response_model=ProjectOut, status_code=201)
 async def create_project(
-    language_code: str = Form(..., min_length=2, max_length=2),
+    language_code: Annotated[LanguageCode, Form()],
+    background_tasks: BackgroundTasks,
+    svc: ProjectSvc,
+    current_user: CurrentUser,
     original_file: UploadFile = File(...),
-    db: Db = None,
-    current_user: CurrentUser = None,
 ) -> ProjectOut:
     """Create a new translation project and assign a translator.
 
@@ -110,9 +194,10 @@ async def create_project(
 
     Args:
         language_code: Target language (ISO 639-1).
-        original_file: Uploaded file (any type).
-        db: MongoDB database dependency.
+        background_tasks: Background tasks used for email notifications.
+        svc: Project service dependency.
         current_user: Authenticated user.
+        original_file: Uploaded file (any type).
 
     Returns:
         ProjectOut: Created project representation.
@@ -120,42 +205,23 @@ async def create_project(
     Raises:
         HTTPException: If user role is not CUSTOMER or upload is too large.
     """
-    content: bytes = await original_file.read()
-
-    project_repo: ProjectRepository = ProjectRepository(db)
-    translator_lang_repo: TranslatorLanguageRepository = TranslatorLanguageRepository(db)
-    user_repo: UserRepository = UserRepository(db)
-    fs: GridFsService = GridFsService(db)
-    mailer: EmailService = EmailService()
-
-    svc: ProjectService = ProjectService(
-        project_repo=project_repo,
-        translator_lang_repo=translator_lang_repo,
-        user_repo=user_repo,
-        gridfs=fs,
-        mailer=mailer,
-    )
-
     result: CreateProjectResult = await svc.create_project(
         customer=current_user,
         language_code=language_code,
         original_filename=original_file.filename or "upload.bin",
         content_type=original_file.content_type or "application/octet-stream",
-        content=content,
+        source=original_file,
+        size=original_file.size,
+        background_tasks=background_tasks,
     )
 
-    p: Project = result.project
-    return ProjectOut(
-        id=p.id,
-        customer_id=p.customer_id,
-        translator_id=p.translator_id,
-        language_code=p.language_code,
-        state=p.state.value if hasattr(p.state, "value") else str(p.state),
-    )
+    return ProjectOut.model_validate(result.project)
 
 
 @router.get("/{project_id}/original")
-async def download_original_file(project_id: UUID, db: Db, current_user: CurrentUser) -> Response:
+async def download_original_file(
+    project_id: UUID, request: Request, repo: ProjectRepo, fs: GridFs, current_user: CurrentUser
+) -> Response:
     """Download the original file for a project.
 
     Access rules:
@@ -164,16 +230,17 @@ async def download_original_file(project_id: UUID, db: Db, current_user: Current
 
     Args:
         project_id: Project UUID.
-        db: MongoDB database dependency.
+        request: Incoming request (for conditional GET).
+        repo: Project repository dependency.
+        fs: GridFS service dependency.
         current_user: Authenticated user.
 
     Returns:
-        Response: File download response.
+        Response: Streamed file download, or 304 Not Modified.
 
     Raises:
         HTTPException: If project/file is not found or access is denied.
     """
-    repo: ProjectRepository = ProjectRepository(db)
     project: Project | None = await repo.get_by_id(project_id)
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -183,24 +250,15 @@ async def download_original_file(project_id: UUID, db: Db, current_user: Current
     if current_user.role == UserRole.TRANSLATOR and project.translator_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not allowed")
 
-    try:
-        oid: ObjectId = ObjectId(project.original_file_id)
-    except Exception:
+    if not ObjectId.is_valid(project.original_file_id):
         raise HTTPException(status_code=500, detail="Invalid file id")
+    oid: ObjectId = ObjectId(project.original_file_id)
 
-    fs: GridFsService = GridFsService(db)
-    data, info = await fs.download(oid)
-
-    metadata: dict = info.get("metadata") or dict()
-    content_type: str | None = metadata.get("content_type") or "application/octet-stream"
-    filename: str | None = info.get("filename") or "download.bin"
-
-    headers: dict[str, str] = {"Content-Disposition": f"attachment; filename=\"{filename}\""}
-    return Response(content=data, media_type=content_type, headers=headers)
+    return await _stream_file(request, fs, oid, "download.bin", _ORIGINAL_CACHE_CONTROL)
 
 
 @router.get("/{project_id}", response_model=Project)
-async def get_project(project_id: UUID, db: Db, current_user: CurrentUser) -> Project:
+async def get_project(project_id: UUID, repo: ProjectRepo, current_user: CurrentUser) -> Project:
     """Get a project by id.
 
     Access rules:
@@ -209,13 +267,12 @@ async def get_project(project_id: UUID, db: Db, current_user: CurrentUser) -> Pr
 
     Args:
         project_id: Project UUID.
-        db: MongoDB database dependency.
+        repo: Project repository dependency.
         current_user: Authenticated user.
 
     Returns:
         Project: Full project model.
     """
-    repo: ProjectRepository = ProjectRepository(db)
     project: Project | None = await repo.get_by_id(project_id)
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -229,7 +286,7 @@ async def get_project(project_id: UUID, db: Db, current_user: CurrentUser) -> Pr
 
 
 @router.get("", response_model=list[ProjectListItemOut])
-async def list_projects(db: Db, current_user: CurrentUser) -> list[ProjectListItemOut]:
+async def list_projects(project_repo: ProjectRepo, current_user: CurrentUser) -> list[ProjectListItemOut]:
     """List projects for the current user.
 
     Behavior:
@@ -237,57 +294,45 @@ async def list_projects(db: Db, current_user: CurrentUser) -> list[ProjectListIt
         - TRANSLATOR: list active projects assigned to the user
 
     Args:
-        db: MongoDB database dependency.
+        project_repo: Project repository dependency.
         current_user: Authenticated user.
 
     Returns:
-        list[ProjectListItemOut]: Project list rows.
+        list[ProjectListItemOut]: Project list rows (built with `model_construct`; the
+        repository already returns validated, correctly typed values).
     """
-    project_repo: ProjectRepository = ProjectRepository(db)
-    user_repo: UserRepository = UserRepository(db)
-
     if current_user.role == UserRole.CUSTOMER:
-        projects: list[Project]= await project_repo.list_by_customer(current_user.id)
-        translator_ids: list[UUID] = sorted({p.translator_id for p in projects if p.translator_id is not None})
-        translator_names: dict[str, str] = await user_repo.map_ids_to_names(translator_ids) if translator_ids else dict()
-
-        file_name_map: dict[str, str] = await _map_gridfs_filenames(db, [p.original_file_id for p in projects])
-
+        rows: list[tuple[Project, str | None]] = await project_repo.list_by_customer_with_translator_names(current_user.id)
         return [
-            ProjectListItemOut(
+            ProjectListItemOut.model_construct(
                 id=p.id,
                 language_code=p.language_code,
-                original_file_name=file_name_map.get(p.original_file_id),
-                state=p.state.value if hasattr(p.state, "value") else str(p.state),
-                created_at=p.created_at.isoformat() if getattr(p, "created_at", None) else None,
+                original_file_name=p.original_file_name,
+                state=p.state_str,
+                created_at=p.created_at_iso,
                 customer_id=p.customer_id,
                 customer_name=None,
                 translator_id=p.translator_id,
-                translator_name=translator_names.get(str(p.translator_id)) if p.translator_id else None,
+                translator_name=translator_name if p.translator_id else None,
             )
-            for p in projects
+            for p, translator_name in rows
         ]
 
     if current_user.role == UserRole.TRANSLATOR:
-        projects = await project_repo.list_by_translator(current_user.id)
-        customer_ids: list[UUID] = sorted({p.customer_id for p in projects})
-        customer_names: dict[str, str] = await user_repo.map_ids_to_names(customer_ids) if customer_ids else dict()
-
-        file_name_map = await _map_gridfs_filenames(db, [p.original_file_id for p in projects])
-
+        rows = await project_repo.list_by_translator_with_customer_names(current_user.id)
         return [
-            ProjectListItemOut(
+            ProjectListItemOut.model_construct(
                 id=p.id,
                 language_code=p.language_code,
-                original_file_name=file_name_map.get(p.original_file_id),
-                state=p.state.value if hasattr(p.state, "value") else str(p.state),
-                created_at=p.created_at.isoformat() if getattr(p, "created_at", None) else None,
+                original_file_name=p.original_file_name,
+                state=p.state_str,
+                created_at=p.created_at_iso,
                 customer_id=p.customer_id,
-                customer_name=customer_names.get(str(p.customer_id)),
+                customer_name=customer_name,
                 translator_id=p.translator_id,
                 translator_name=None,
             )
-            for p in projects
+            for p, customer_name in rows
         ]
 
     raise HTTPException(status_code=403, detail="Not implemented for this role")
@@ -296,9 +341,13 @@ async def list_projects(db: Db, current_user: CurrentUser) -> list[ProjectListIt
 @router.post("/{project_id}/translation", status_code=204)
 async def submit_translation(
     project_id: UUID,
+    background_tasks: BackgroundTasks,
+    repo: ProjectRepo,
+    fs: GridFs,
+    users: UserRepo,
+    mailer: Mailer,
+    current_user: CurrentUser,
     translated_file: UploadFile = File(...),
-    db: Db = None,
-    current_user: CurrentUser = None,
 ) -> None:
     """Upload translated file for an assigned project.
 
@@ -307,9 +356,13 @@ async def submit_translation(
 
     Args:
         project_id: Project UUID.
-        translated_file: Uploaded translated file.
-        db: MongoDB database dependency.
+        background_tasks: Background tasks used for email notifications.
+        repo: Project repository dependency.
+        fs: GridFS service dependency.
+        users: User repository dependency.
+        mailer: Email service dependency.
         current_user: Authenticated user.
+        translated_file: Uploaded translated file.
 
     Raises:
         HTTPException: If project is not found, access is denied, state is invalid,
@@ -318,7 +371,6 @@ async def submit_translation(
     if current_user.role != UserRole.TRANSLATOR:
         raise HTTPException(status_code=403, detail="Only translators can submit translations")
 
-    repo: ProjectRepository = ProjectRepository(db)
     project: Project | None = await repo.get_by_id(project_id)
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -326,20 +378,22 @@ async def submit_translation(
     if project.translator_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not allowed")
 
-    if project.state not in ("ASSIGNED", "COMPLETED") and getattr(project.state, "value", None) not in ("ASSIGNED", "COMPLETED"):
+    if project.state_str not in ("ASSIGNED", "COMPLETED"):
         raise HTTPException(status_code=409, detail="Project is not in a state that allows translation upload")
 
     max_bytes: int = settings.max_upload_mb * 1024 * 1024
-    content: bytes = await translated_file.read()
-    if len(content) > max_bytes:
+    if translated_file.size is not None and translated_file.size > max_bytes:
         raise HTTPException(status_code=413, detail=f"Max upload size is {settings.max_upload_mb} MB")
 
-    fs: GridFsService = GridFsService(db)
-    file_id: ObjectId = await fs.upload(
-        filename=translated_file.filename or "translation.bin",
-        data=content,
-        metadata={"content_type": translated_file.content_type or "application/octet-stream"},
-    )
+    try:
+        file_id: ObjectId = await fs.upload_stream(
+            filename=translated_file.filename or "translation.bin",
+            source=translated_file,
+            metadata={"content_type": translated_file.content_type or "application/octet-stream"},
+            max_bytes=max_bytes,
+        )
+    except UploadTooLargeError:
+        raise HTTPException(status_code=413, detail=f"Max upload size is {settings.max_upload_mb} MB")
 
     ok: bool = await repo.submit_translation(
         project_id=project_id,
@@ -349,10 +403,10 @@ async def submit_translation(
     if not ok:
         raise HTTPException(status_code=409, detail="Failed to update project")
 
-    users: UserRepository = UserRepository(db)
     customer: User | None = await users.get_by_id(project.customer_id)
     if customer is not None:
-        EmailService().send(
+        background_tasks.add_task(
+            mailer.send_async,
             to=str(customer.email_address),
             subject="Your translation is ready",
             text=(
@@ -366,7 +420,9 @@ async def submit_translation(
 
 
 @router.get("/{project_id}/translated")
-async def download_translated_file(project_id: UUID, db: Db, current_user: CurrentUser) -> Response:
+async def download_translated_file(
+    project_id: UUID, request: Request, repo: ProjectRepo, fs: GridFs, current_user: CurrentUser
+) -> Response:
     """Download the translated file for a project.
 
     Access rules:
@@ -375,16 +431,17 @@ async def download_translated_file(project_id: UUID, db: Db, current_user: Curre
 
     Args:
         project_id: Project UUID.
-        db: MongoDB database dependency.
+        request: Incoming request (for conditional GET).
+        repo: Project repository dependency.
+        fs: GridFS service dependency.
         current_user: Authenticated user.
 
     Returns:
-        Response: File download response.
+        Response: Streamed file download, or 304 Not Modified.
 
     Raises:
         HTTPException: If file does not exist, project not found, or access is denied.
     """
-    repo: ProjectRepository = ProjectRepository(db)
     project: Project | None = await repo.get_by_id(project_id)
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -397,20 +454,11 @@ async def download_translated_file(project_id: UUID, db: Db, current_user: Curre
     if not project.translated_file_id:
         raise HTTPException(status_code=404, detail="Translated file not found")
 
-    try:
-        oid: ObjectId = ObjectId(project.translated_file_id)
-    except Exception:
+    if not ObjectId.is_valid(project.translated_file_id):
         raise HTTPException(status_code=500, detail="Invalid file id")
+    oid: ObjectId = ObjectId(project.translated_file_id)
 
-    fs: GridFsService = GridFsService(db)
-    data, info = await fs.download(oid)
-
-    metadata: dict = info.get("metadata") or dict()
-    content_type: str | None = metadata.get("content_type") or "application/octet-stream"
-    filename: str = info.get("filename") or "translated.bin"
-
-    headers: dict[str, str] = {"Content-Disposition": f"attachment; filename=\"{filename}\""}
-    return Response(content=data, media_type=content_type, headers=headers)
+    return await _stream_file(request, fs, oid, "translated.bin", _TRANSLATED_CACHE_CONTROL)
 
 
 class ApproveIn(BaseModel):
@@ -426,7 +474,16 @@ class RejectIn(BaseModel):
 
 
 @router.post("/{project_id}/approve", status_code=204)
-async def approve_project(project_id: UUID, payload: ApproveIn, db: Db, current_user: CurrentUser) -> None:
+async def approve_project(
+    project_id: UUID,
+    payload: ApproveIn,
+    background_tasks: BackgroundTasks,
+    svc: ReviewSvc,
+    repo: ProjectRepo,
+    users: UserRepo,
+    mailer: Mailer,
+    current_user: CurrentUser,
+) -> None:
     """Approve a completed translation and optionally submit feedback.
 
     Also notifies the translator by email.
@@ -434,7 +491,11 @@ async def approve_project(project_id: UUID, payload: ApproveIn, db: Db, current_
     Args:
         project_id: Project UUID.
         payload: Approval payload.
-        db: MongoDB database dependency.
+        background_tasks: Background tasks used for email notifications.
+        svc: Review service dependency.
+        repo: Project repository dependency.
+        users: User repository dependency.
+        mailer: Email service dependency.
         current_user: Authenticated user.
 
     Raises:
@@ -443,20 +504,16 @@ async def approve_project(project_id: UUID, payload: ApproveIn, db: Db, current_
     if current_user.role != UserRole.CUSTOMER:
         raise HTTPException(status_code=403, detail="Only customers can approve")
 
-    repo: ProjectRepository = ProjectRepository(db)
-    feedback_repo: FeedbackRepository = FeedbackRepository(db)
-    svc: ProjectReviewService = ProjectReviewService(repo, feedback_repo)
-
     res: ReviewResult | None = await svc.approve(project_id=project_id, customer_id=current_user.id, text=payload.text)
     if res is None:
         raise HTTPException(status_code=409, detail="Project is not in COMPLETED state")
 
     project: Project | None = await repo.get_by_id(project_id)
     if project and project.translator_id:
-        users: UserRepository = UserRepository(db)
         translator: User | None = await users.get_by_id(project.translator_id)
         if translator is not None:
-            EmailService().send(
+            background_tasks.add_task(
+                mailer.send_async,
                 to=str(translator.email_address),
                 subject="Translation approved",
                 text=(
@@ -470,7 +527,16 @@ async def approve_project(project_id: UUID, payload: ApproveIn, db: Db, current_
 
 
 @router.post("/{project_id}/reject", status_code=204)
-async def reject_project(project_id: UUID, payload: RejectIn, db: Db, current_user: CurrentUser) -> None:
+async def reject_project(
+    project_id: UUID,
+    payload: RejectIn,
+    background_tasks: BackgroundTasks,
+    svc: ReviewSvc,
+    repo: ProjectRepo,
+    users: UserRepo,
+    mailer: Mailer,
+    current_user: CurrentUser,
+) -> None:
     """Reject a completed translation and submit feedback.
 
     Also notifies the translator by email.
@@ -478,7 +544,11 @@ async def reject_project(project_id: UUID, payload: RejectIn, db: Db, current_us
     Args:
         project_id: Project UUID.
         payload: Rejection payload.
-        db: MongoDB database dependency.
+        background_tasks: Background tasks used for email notifications.
+        svc: Review service dependency.
+        repo: Project repository dependency.
+        users: User repository dependency.
+        mailer: Email service dependency.
         current_user: Authenticated user.
 
     Raises:
@@ -487,20 +557,16 @@ async def reject_project(project_id: UUID, payload: RejectIn, db: Db, current_us
     if current_user.role != UserRole.CUSTOMER:
         raise HTTPException(status_code=403, detail="Only customers can reject")
 
-    repo: ProjectRepository = ProjectRepository(db)
-    feedback_repo: FeedbackRepository = FeedbackRepository(db)
-    svc: ProjectReviewService = ProjectReviewService(repo, feedback_repo)
-
     res: ReviewResult | None = await svc.reject(project_id=project_id, customer_id=current_user.id, text=payload.text)
     if res is None:
         raise HTTPException(status_code=409, detail="Project is not in COMPLETED state")
 
     project: Project | None= await repo.get_by_id(project_id)
     if project and project.translator_id:
-        users: UserRepository = UserRepository(db)
         translator: User | None = await users.get_by_id(project.translator_id)
         if translator is not None:
-            EmailService().send(
+            background_tasks.add_task(
+                mailer.send_async,
                 to=str(translator.email_address),
                 subject="Translation rejected",
                 text=(
@@ -515,16 +581,16 @@ async def reject_project(project_id: UUID, payload: RejectIn, db: Db, current_us
 
 @router.get("/admin/feedback", response_model=list[AdminFeedbackProjectOut])
 async def admin_list_projects_with_feedback(
+    repo: ProjectRepo,
+    current_user: CurrentUser,
     state: str | None = None,
-    db: Db = None,
-    current_user: CurrentUser = None,
 ) -> list[AdminFeedbackProjectOut]:
     """List projects with feedback for administrator view.
 
     Args:
-        state: Optional state filter.
-        db: MongoDB database dependency.
+        repo: Project repository dependency.
         current_user: Authenticated user.
+        state: Optional state filter.
 
     Returns:
         list[AdminFeedbackProjectOut]: Projects with feedback and user details.
@@ -535,54 +601,25 @@ async def admin_list_projects_with_feedback(
     if current_user.role != UserRole.ADMINISTRATOR:
         raise HTTPException(status_code=403, detail="Only administrators")
 
-    user_repo: UserRepository = UserRepository(db)
-    fb_repo: FeedbackRepository = FeedbackRepository(db)
-
-    query: dict[str, Any] = {"$or": [{"feedback_id": {"$exists": True, "$ne": None}}, {"feedback": {"$ne": None}}]}
-    if state:
-        query["state"] = state
-
-    cursor: AsyncIOMotorCursor[Mapping[str, Any]] = db["projects"].find(query).sort("created_at", -1)
-    docs: list[Mapping[str, Any]] = await cursor.to_list(length=200)
-    projects: list[Project] = [Project.model_validate(d) for d in docs]
-
-    customer_ids: list[UUID] = sorted({p.customer_id for p in projects})
-    translator_ids: list[UUID] = sorted({p.translator_id for p in projects if p.translator_id is not None})
-
-    customers: dict[str, User] = {str(u.id): u for u in await user_repo.list_by_ids(customer_ids)} if customer_ids else {}
-    translators: dict[str, User] = {str(u.id): u for u in await user_repo.list_by_ids(translator_ids)} if translator_ids else {}
-
-    out: list[AdminFeedbackProjectOut] = []
-    for p in projects:
-        fb_text: str | None = None
-
-        if p.feedback_id is not None:
-            fb: Feedback | None = await fb_repo.get_by_project_id(p.id)
-            fb_text = fb.text if fb else None
-        else:
-            fb = await fb_repo.get_by_project_id(p.id)
-            fb_text = fb.text if fb else None
-
-        cu: User | None = customers.get(str(p.customer_id))
-        tu: User | None = translators.get(str(p.translator_id)) if p.translator_id else None
-
-        out.append(
-            AdminFeedbackProjectOut(
-                id=p.id,
-                language_code=p.language_code,
-                state=p.state.value if hasattr(p.state, "value") else str(p.state),
-                customer_id=p.customer_id,
-                customer_name=cu.name if cu else None,
-                customer_email=str(cu.email_address) if cu else None,
-                translator_id=p.translator_id,
-                translator_name=tu.name if tu else None,
-                translator_email=str(tu.email_address) if tu else None,
-                feedback_text=fb_text,
-                created_at=p.created_at.isoformat() if getattr(p, "created_at", None) else None,
-            )
+    rows: list[Mapping[str, Any]] = await repo.list_with_feedback_joined(state)
+    # Rows come from our own collections, so skip per-field validation; ids are
+    # stored as strings and only need converting back to UUIDs.
+    return [
+        AdminFeedbackProjectOut.model_construct(
+            id=UUID(r["id"]),
+            language_code=r["language_code"],
+            state=r["state"],
+            customer_id=UUID(r["customer_id"]),
+            customer_name=r.get("customer_name"),
+            customer_email=r.get("customer_email"),
+            translator_id=UUID(r["translator_id"]) if r.get("translator_id") else None,
+            translator_name=r.get("translator_name"),
+            translator_email=r.get("translator_email"),
+            feedback_text=r.get("feedback_text"),
+            created_at=_iso_or_none(r.get("created_at")),
         )
-
-    return out
+        for r in rows
+    ]
 
 
 class AdminMessageIn(BaseModel):
@@ -597,15 +634,21 @@ class AdminMessageIn(BaseModel):
 async def admin_send_message(
     project_id: UUID,
     payload: AdminMessageIn,
-    db: Db = None,
-    current_user: CurrentUser = None,
+    background_tasks: BackgroundTasks,
+    repo: ProjectRepo,
+    users: UserRepo,
+    mailer: Mailer,
+    current_user: CurrentUser,
 ) -> None:
     """Send an admin message to customer or translator.
 
     Args:
         project_id: Project UUID.
         payload: Message payload.
-        db: MongoDB database dependency.
+        background_tasks: Background tasks used for email notifications.
+        repo: Project repository dependency.
+        users: User repository dependency.
+        mailer: Email service dependency.
         current_user: Authenticated user.
 
     Raises:
@@ -614,20 +657,23 @@ async def admin_send_message(
     if current_user.role != UserRole.ADMINISTRATOR:
         raise HTTPException(status_code=403, detail="Only administrators")
 
-    repo: ProjectRepository = ProjectRepository(db)
     project: Project | None = await repo.get_by_id(project_id)
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    users: UserRepository = UserRepository(db)
-    customer: User | None = await users.get_by_id(project.customer_id)
-    translator: User | None = await users.get_by_id(project.translator_id) if project.translator_id else None
+    customer: User | None
+    translator: User | None
+    customer, translator = await asyncio.gather(
+        users.get_by_id(project.customer_id),
+        users.get_by_id(project.translator_id) if project.translator_id else _none(),
+    )
 
     target: str = (payload.to or "").lower()
     if target == "customer":
         if customer is None:
             raise HTTPException(status_code=404, detail="Customer not found")
-        EmailService().send(
+        background_tasks.add_task(
+            mailer.send_async,
             to=str(customer.email_address),
             subject=payload.subject,
             text=f"[Project {project_id}]\n\n{payload.text}",
@@ -637,7 +683,8 @@ async def admin_send_message(
     if target == "translator":
         if translator is None:
             raise HTTPException(status_code=404, detail="Translator not found")
-        EmailService().send(
+        background_tasks.add_task(
+            mailer.send_async,
             to=str(translator.email_address),
             subject=payload.subject,
             text=f"[Project {project_id}]\n\n{payload.text}",
@@ -648,14 +695,24 @@ async def admin_send_message(
 
 
 @router.post("/admin/projects/{project_id}/close", status_code=204)
-async def admin_close_project(project_id: UUID, db: Db, current_user: CurrentUser) -> None:
+async def admin_close_project(
+    project_id: UUID,
+    background_tasks: BackgroundTasks,
+    repo: ProjectRepo,
+    users: UserRepo,
+    mailer: Mailer,
+    current_user: CurrentUser,
+) -> None:
     """Close a project as an administrator.
 
     Notifies both customer and translator by email (if present).
 
     Args:
         project_id: Project UUID.
-        db: MongoDB database dependency.
+        background_tasks: Background tasks used for email notifications.
+        repo: Project repository dependency.
+        users: User repository dependency.
+        mailer: Email service dependency.
         current_user: Authenticated user.
 
     Raises:
@@ -664,26 +721,28 @@ async def admin_close_project(project_id: UUID, db: Db, current_user: CurrentUse
     if current_user.role != UserRole.ADMINISTRATOR:
         raise HTTPException(status_code=403, detail="Only administrators")
 
-    repo: ProjectRepository = ProjectRepository(db)
     project: Project | None = await repo.get_by_id(project_id)
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    await repo.close_project(project_id)
-
-    users: UserRepository = UserRepository(db)
-    customer: User | None = await users.get_by_id(project.customer_id)
-    translator: User | None = await users.get_by_id(project.translator_id) if project.translator_id else None
+    customer: User | None
+    translator: User | None
+    _, customer, translator = await asyncio.gather(
+        repo.close_project(project_id),
+        users.get_by_id(project.customer_id),
+        users.get_by_id(project.translator_id) if project.translator_id else _none(),
+    )
 
-    mailer = EmailService()
     if customer is not None:
-        mailer.send(
+        background_tasks.add_task(
+            mailer.send_async,
             to=str(customer.email_address),
             subject="Project closed",
             text=f"Hi {customer.name},\n\nProject {project_id} has been closed by administrator.\n",
         )
     if translator is not None:
-        mailer.send(
+        background_tasks.add_task(
+            mailer.send_async,
             to=str(translator.email_address),
             subject="Project closed",
             text=f"Hi {translator.name},\n\nProject {project_id} has been closed by administrator.\n",
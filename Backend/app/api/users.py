@@ -1,21 +1,29 @@
 from __future__ import annotations
 
 import logging
+from typing import Annotated
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, EmailStr, Field
+from cachetools import TTLCache
+from fastapi import APIRouter, Body, HTTPException, Path
+from pydantic import BaseModel, Field, field_validator
+from pymongo.errors import DuplicateKeyError
 
-from app.api.deps import CurrentUser, Db
-from app.domain.enums import UserRole
-from app.domain.models import TranslatorLanguage, User
-from app.repositories.translator_languages import TranslatorLanguageRepository
+from app.api.deps import CurrentUser, TranslatorLangRepo, UserRepo
+from app.domain.enums import ADMIN, TRANSLATOR, UserRole
+from app.domain.models import EmailAddress, LanguageCode, TranslatorLanguage, User
 from app.repositories.users import UserRepository
+from app.security.passwords import hash_password_async
 
 logger = logging.getLogger(__name__)
 
 router: APIRouter = APIRouter(prefix="/users", tags=["users"])
 
+# (name, email) pairs that recently failed registration on a unique index. Retries
+# within the TTL get 409 without paying for another Argon2 hash.
+_REGISTER_CONFLICT_TTL_SECONDS: float = 60.0
+_register_conflicts: TTLCache[tuple[str, str], bool] = TTLCache(maxsize=50_000, ttl=_REGISTER_CONFLICT_TTL_SECONDS)
+
 
 class RegisterUserIn(BaseModel):
     """Request body for user registration.
@@ -26,25 +34,39 @@ class RegisterUserIn(BaseModel):
         password: Plaintext password (hashed server-side).
     """
 
-    name: str = Field(pattern=r"^[A-Za-z0-9]+$", description="Alfanumerický username")
-    email_address: EmailStr
+    name: str = Field(description="Alfanumerický username")
+    email_address: EmailAddress
 
     password: str = Field(min_length=8, description="Plaintext password (will be hashed on server)")
 
+    @field_validator("name")
+    @classmethod
+    def _check_name(cls, value: str) -> str:
+        """Validate that the username is non-empty ASCII alphanumeric.
+
+        `isascii()` + `isalnum()` is equivalent to `^[A-Za-z0-9]+$` without a regex pass.
+        """
+        if not (value.isascii() and value.isalnum()):
+            raise ValueError("name must be alphanumeric ASCII")
+        return value
+
 
 class RegisterUserOut(BaseModel):
-    """Response model returned after registration."""
+    """Response model returned after registration.
+
+    Built with `model_construct` from an already validated `User`.
+    """
 
     id: UUID
     name: str
-    email_address: EmailStr
+    email_address: str
     role: UserRole
 
 
 class AddTranslatorLanguageIn(BaseModel):
     """Request body for adding a translator language."""
 
-    language_code: str = Field(min_length=2, max_length=2, description="ISO 639-1")
+    language_code: LanguageCode
 
 
 class TranslatorLanguageOut(BaseModel):
@@ -54,6 +76,13 @@ class TranslatorLanguageOut(BaseModel):
     language_code: str
 
 
+class BulkAddTranslatorLanguagesOut(BaseModel):
+    """Response model returned after adding several translator languages."""
+
+    inserted: int
+    existing: int
+
+
 class TranslatorLanguagesOut(BaseModel):
     """Response model listing translator languages."""
 
@@ -61,74 +90,80 @@ class TranslatorLanguagesOut(BaseModel):
     languages: list[str]
 
 
-@router.post("/customers/register", response_model=RegisterUserOut, status_code=201)
-async def register_customer(payload: RegisterUserIn, db: Db) -> RegisterUserOut:
-    """Register a new customer account.
+async def _register(payload: RegisterUserIn, repo: UserRepository, role: UserRole) -> RegisterUserOut:
+    """Create a user account with the given role.
+
+    A (name, email) pair that just hit the unique index is answered with 409 from
+    `_register_conflicts` without hashing the password again.
 
     Args:
         payload: Registration payload.
-        db: MongoDB database dependency.
+        repo: User repository.
+        role: Role of the new account.
 
     Returns:
         RegisterUserOut: Created user info.
 
     Raises:
-        HTTPException: If user already exists.
+        HTTPException: 409 if the name or email is already taken.
     """
-    repo: UserRepository = UserRepository(db)
-    await repo.ensure_indexes()
-
-    from app.security.passwords import hash_password
+    key: tuple[str, str] = (payload.name, payload.email_address)
+    if key in _register_conflicts:
+        raise HTTPException(status_code=409, detail="User with this email or name already exists")
 
     user: User = User(
         id=uuid4(),
         name=payload.name,
         email_address=payload.email_address,
-        role=UserRole.CUSTOMER,
-        password_hash=hash_password(payload.password),
+        role=role,
+        password_hash=await hash_password_async(payload.password),
     )
 
     try:
         await repo.create(user)
-    except Exception as ex:
-        logger.warning("Failed to create customer", exc_info=ex)
+    except DuplicateKeyError as ex:
+        _register_conflicts[key] = True
+        logger.warning("Failed to create %s", role.value.lower(), exc_info=ex)
         raise HTTPException(status_code=409, detail="User with this email or name already exists")
 
-    return RegisterUserOut(id=user.id, name=user.name, email_address=user.email_address, role=user.role)
+    return RegisterUserOut.model_construct(
+        id=user.id,
+        name=user.name,
+        email_address=user.email_address,
+        role=user.role,
+    )
 
 
-@router.post("/translators/register", response_model=RegisterUserOut, status_code=201)
-async def register_translator(payload: RegisterUserIn, db: Db) -> RegisterUserOut:
-    """Register a new translator account."""
-    repo: UserRepository = UserRepository(db)
-    await repo.ensure_indexes()
+@router.post("/customers/register", response_model=RegisterUserOut, status_code=201)
+async def register_customer(payload: RegisterUserIn, repo: UserRepo) -> RegisterUserOut:
+    """Register a new customer account.
 
-    from app.security.passwords import hash_password
+    Args:
+        payload: Registration payload.
+        repo: User repository dependency.
 
-    user: User = User(
-        id=uuid4(),
-        name=payload.name,
-        email_address=payload.email_address,
-        role=UserRole.TRANSLATOR,
-        password_hash=hash_password(payload.password),
-    )
+    Returns:
+        RegisterUserOut: Created user info.
+
+    Raises:
+        HTTPException: If user already exists.
+    """
+    return await _register(payload, repo, UserRole.CUSTOMER)
 
-    try:
-        await repo.create(user)
-    except Exception as ex:
-        logger.warning("Failed to create translator", exc_info=ex)
-        raise HTTPException(status_code=409, detail="User with this email or name already exists")
 
-    return RegisterUserOut(id=user.id, name=user.name, email_address=user.email_address, role=user.role)
+@router.post("/translators/register", response_model=RegisterUserOut, status_code=201)
+async def register_translator(payload: RegisterUserIn, repo: UserRepo) -> RegisterUserOut:
+    """Register a new translator account."""
+    return await _register(payload, repo, UserRole.TRANSLATOR)
 
 
 @router.get("/{user_id}", response_model=RegisterUserOut)
-async def get_user(user_id: UUID, db: Db) -> RegisterUserOut:
+async def get_user(user_id: UUID, repo: UserRepo) -> RegisterUserOut:
     """Get a user by id.
 
     Args:
         user_id: User UUID.
-        db: MongoDB database dependency.
+        repo: User repository dependency.
 
     Returns:
         RegisterUserOut: User info.
@@ -136,12 +171,20 @@ async def get_user(user_id: UUID, db: Db) -> RegisterUserOut:
     Raises:
         HTTPException: If not found.
     """
-    repo: UserRepository = UserRepository(db)
     user: User | None = await repo.get_by_id(user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return RegisterUserOut(id=user.id, name=user.name, email_address=user.email_address, role=user.role)
+    return RegisterUserOut.model_construct(
+        id=user.id,
+        name=user.name,
+        email_address=user.email_address,
+        role=user.role,
+    )
+
+
+# Roles allowed to manage any translator's languages.
+_LANGUAGE_ADMIN_ROLES: frozenset[UserRole] = frozenset({ADMIN})
 
 
 def _assert_language_access(*, current_user: User, translator_id: UUID) -> None:
@@ -154,9 +197,10 @@ def _assert_language_access(*, current_user: User, translator_id: UUID) -> None:
     Raises:
         HTTPException: If access is denied.
     """
-    if current_user.role == UserRole.ADMINISTRATOR:
+    role: UserRole = current_user.role
+    if role in _LANGUAGE_ADMIN_ROLES:
         return
-    if current_user.role == UserRole.TRANSLATOR and current_user.id == translator_id:
+    if role is TRANSLATOR and current_user.id == translator_id:
         return
     raise HTTPException(status_code=403, detail="Not allowed")
 
@@ -164,7 +208,7 @@ def _assert_language_access(*, current_user: User, translator_id: UUID) -> None:
 @router.get("/translators/{translator_id}/languages", response_model=TranslatorLanguagesOut)
 async def list_translator_languages(
     translator_id: UUID,
-    db: Db,
+    tl_repo: TranslatorLangRepo,
     current_user: CurrentUser,
 ) -> TranslatorLanguagesOut:
     """List languages configured for a translator.
@@ -175,7 +219,7 @@ async def list_translator_languages(
 
     Args:
         translator_id: Translator UUID.
-        db: MongoDB database dependency.
+        tl_repo: Translator language repository dependency.
         current_user: Authenticated user.
 
     Returns:
@@ -183,63 +227,89 @@ async def list_translator_languages(
     """
     _assert_language_access(current_user=current_user, translator_id=translator_id)
 
-    users: UserRepository = UserRepository(db)
-    translator: User | None = await users.get_by_id(translator_id)
-    if translator is None or translator.role != UserRole.TRANSLATOR:
+    found: tuple[UserRole, list[str]] | None = await tl_repo.get_translator_with_languages(translator_id)
+    if found is None or found[0] is not TRANSLATOR:
         raise HTTPException(status_code=404, detail="Translator not found")
 
-    tl_repo: TranslatorLanguageRepository = TranslatorLanguageRepository(db)
-    await tl_repo.ensure_indexes()
-
-    langs: list[str] = await tl_repo.list_languages_for_translator(str(translator_id))
-    langs_sorted: list[str] = sorted({l.lower() for l in langs})
-    return TranslatorLanguagesOut(translator_id=translator_id, languages=langs_sorted)
+    return TranslatorLanguagesOut(translator_id=translator_id, languages=found[1])
 
 
 @router.post("/translators/{translator_id}/languages", response_model=TranslatorLanguageOut, status_code=201)
 async def add_translator_language(
     translator_id: UUID,
     payload: AddTranslatorLanguageIn,
-    db: Db,
+    users: UserRepo,
+    tl_repo: TranslatorLangRepo,
     current_user: CurrentUser,
 ) -> TranslatorLanguageOut:
     """Add a language for a translator."""
     _assert_language_access(current_user=current_user, translator_id=translator_id)
 
-    users: UserRepository = UserRepository(db)
-    translator: User | None = await users.get_by_id(translator_id)
-    if translator is None or translator.role != UserRole.TRANSLATOR:
+    if await users.get_role(translator_id) is not TRANSLATOR:
         raise HTTPException(status_code=404, detail="Translator not found")
 
-    tl_repo: TranslatorLanguageRepository = TranslatorLanguageRepository(db)
-    await tl_repo.ensure_indexes()
-
-    tl: TranslatorLanguage = TranslatorLanguage(translator_id=translator_id, language_code=payload.language_code.lower())
+    tl: TranslatorLanguage = TranslatorLanguage(translator_id=translator_id, language_code=payload.language_code)
     await tl_repo.add_language(tl)
 
     return TranslatorLanguageOut(translator_id=translator_id, language_code=tl.language_code)
 
 
+@router.post(
+    "/translators/{translator_id}/languages:bulk", response_model=BulkAddTranslatorLanguagesOut, status_code=201
+)
+async def bulk_add_translator_languages(
+    translator_id: UUID,
+    users: UserRepo,
+    tl_repo: TranslatorLangRepo,
+    current_user: CurrentUser,
+    payload: list[AddTranslatorLanguageIn] = Body(min_length=1, max_length=200),
+) -> BulkAddTranslatorLanguagesOut:
+    """Add several languages for a translator in one database round trip.
+
+    Args:
+        translator_id: Translator UUID.
+        users: User repository dependency.
+        tl_repo: Translator language repository dependency.
+        current_user: Authenticated user.
+        payload: Languages to add (duplicates are ignored).
+
+    Returns:
+        BulkAddTranslatorLanguagesOut: How many languages were added vs already present.
+
+    Raises:
+        HTTPException: If access is denied or the translator does not exist.
+    """
+    _assert_language_access(current_user=current_user, translator_id=translator_id)
+
+    if await users.get_role(translator_id) is not TRANSLATOR:
+        raise HTTPException(status_code=404, detail="Translator not found")
+
+    codes: set[str] = {item.language_code for item in payload}
+    inserted: int = await tl_repo.add_languages(translator_id, codes)
+
+    return BulkAddTranslatorLanguagesOut(inserted=inserted, existing=len(codes) - inserted)
+
+
 @router.delete("/translators/{translator_id}/languages/{language_code}", status_code=204)
 async def delete_translator_language(
     translator_id: UUID,
-    language_code: str,
-    db: Db,
+    # Not `LanguageCode`: stored codes from before the ISO 639-1 check must stay deletable.
+    language_code: Annotated[str, Path(min_length=2, max_length=2, description="ISO 639-1")],
+    users: UserRepo,
+    tl_repo: TranslatorLangRepo,
     current_user: CurrentUser,
 ) -> None:
-    """Remove a language from a translator."""
+    """Remove a language from a translator.
+
+    The delete runs first; the translator is only looked up when nothing was
+    deleted, to tell a missing translator (404) from an absent language (204).
+    """
     _assert_language_access(current_user=current_user, translator_id=translator_id)
 
-    users: UserRepository = UserRepository(db)
-    translator: User | None = await users.get_by_id(translator_id)
-    if translator is None or translator.role != UserRole.TRANSLATOR:
+    deleted: bool = await tl_repo.delete_language(
+        translator_id=str(translator_id), language_code=language_code.lower()
+    )
+    if not deleted and await users.get_role(translator_id) is not TRANSLATOR:
         raise HTTPException(status_code=404, detail="Translator not found")
 
-    if len(language_code) != 2:
-        raise HTTPException(status_code=422, detail="Invalid language code")
-
-    tl_repo: TranslatorLanguageRepository = TranslatorLanguageRepository(db)
-    await tl_repo.ensure_indexes()
-    await tl_repo.delete_language(translator_id=str(translator_id), language_code=language_code.lower())
-
     return None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -15,17 +16,26 @@ class Settings(BaseSettings):
     Attributes:
         mongodb_uri: MongoDB connection URI.
         mongodb_db: MongoDB database name.
+        mongodb_max_pool_size: Maximum connections in the Motor pool.
+        mongodb_min_pool_size: Connections kept open even when idle (opened at startup).
+        mongodb_max_idle_ms: Idle time after which a pooled connection above the minimum is closed.
+        mongodb_wait_queue_timeout_ms: Max time a request waits for a free pooled connection.
+        mongodb_server_selection_timeout_ms: Max time to find a suitable server before failing.
+        mongodb_compressors: Comma-separated wire compressors to negotiate, e.g. "zstd,zlib" (zstd needs pymongo[zstd]).
         max_upload_mb: Maximum upload size in megabytes.
         jwt_secret: Secret key used to sign JWT tokens (override in env for production).
-        jwt_algorithm: JWT signing algorithm.
+        jwt_algorithm: JWT signing algorithm; restricted to the HMAC family.
         jwt_access_token_exp_minutes: Access token expiration time in minutes.
-        smtp_host: SMTP host (mock server: MailHog in docker-compose).
+        smtp_host: SMTP host (mock server: MailHog in docker-compose); empty disables email.
         smtp_port: SMTP port.
         smtp_from: Default From email address.
         otp_master_secret: Global secret used for OTP-related derivations (override in env).
         otp_issuer: Issuer name used in otpauth provisioning URI.
         otp_interval_seconds: TOTP time step.
         otp_valid_window: Allowed time window for OTP verification.
+        password_hash_time_cost: Argon2id passes (pinned; floor is the RFC 9106 low-memory profile's 3).
+        password_hash_target_ms: Target hash time used by the offline calibration helper.
+        user_cache_ttl_seconds: How long a user loaded by id is served from the in-process cache.
     """
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
@@ -33,13 +43,19 @@ class Settings(BaseSettings):
     # MongoDB
     mongodb_uri: str = "mongodb://localhost:27017"
     mongodb_db: str = "piae"
+    mongodb_max_pool_size: int = 64
+    mongodb_min_pool_size: int = 8
+    mongodb_max_idle_ms: int = 60000
+    mongodb_wait_queue_timeout_ms: int = 2500
+    mongodb_server_selection_timeout_ms: int = 3000
+    mongodb_compressors: str = "zlib"
 
     # Uploads
     max_upload_mb: int = 5
 
     # JWT
     jwt_secret: str = os.environ.get("JWT_SECRET", "jwt-secret-for-dev-only")
-    jwt_algorithm: str = "HS256"
+    jwt_algorithm: Literal["HS256", "HS384", "HS512"] = "HS256"
     jwt_access_token_exp_minutes: int = 60
 
     # SMTP
@@ -53,6 +69,14 @@ class Settings(BaseSettings):
     otp_interval_seconds: int = 30
     otp_valid_window: int = 1
 
+    # Password hashing. The cost is pinned so every worker hashes identically; pick it with
+    # `scripts/calibrate_password_hash.py`, which measures against `password_hash_target_ms`.
+    password_hash_time_cost: int = 3
+    password_hash_target_ms: int = 300
+
+    # In-process caches
+    user_cache_ttl_seconds: float = 30.0
+
 
 settings = Settings()  # loads env/.env via pydantic-settings
 
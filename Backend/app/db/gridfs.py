@@ -1,13 +1,34 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional, Tuple
+from typing import Any, AsyncIterator, Optional, Protocol
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorGridFSBucket, AsyncIOMotorGridOut
+from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorGridFSBucket, AsyncIOMotorGridIn, AsyncIOMotorGridOut
 
 logger = logging.getLogger(__name__)
 
+# Read size used when piping an upload into GridFS.
+_UPLOAD_CHUNK_SIZE: int = 1 << 20
+
+
+class AsyncReadable(Protocol):
+    """Source with an async `read(size)` (e.g. `fastapi.UploadFile`)."""
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+class UploadTooLargeError(Exception):
+    """Raised when a streamed upload exceeds the allowed size.
+
+    Args:
+        max_bytes: Size limit that was exceeded.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(f"Upload exceeds {max_bytes} bytes")
+        self.max_bytes: int = max_bytes
+
 
 class GridFsService:
     """Thin wrapper around MongoDB GridFS (Motor).
@@ -21,52 +42,61 @@ class GridFsService:
         """Initialize the GridFS wrapper."""
         self._bucket: AsyncIOMotorGridFSBucket = AsyncIOMotorGridFSBucket(db, bucket_name=bucket_name)
 
-    async def upload(
+    async def upload_stream(
         self,
         *,
         filename: str,
-        data: bytes,
+        source: AsyncReadable,
         metadata: Optional[dict[str, Any]] = None,
+        max_bytes: Optional[int] = None,
     ) -> ObjectId:
-        """Upload a file to GridFS.
+        """Upload a file to GridFS by piping it chunk by chunk.
+
+        Only one read chunk is held in memory at a time. If `max_bytes` is exceeded the
+        partially written file is aborted (its chunks are removed).
 
         Args:
             filename: Stored filename.
-            data: File bytes.
+            source: Readable source (e.g. `UploadFile`).
             metadata: Optional metadata (e.g., content_type).
+            max_bytes: Optional size limit.
 
         Returns:
             ObjectId: GridFS file id.
+
+        Raises:
+            UploadTooLargeError: If the source is larger than `max_bytes`.
         """
-        file_id: ObjectId = await self._bucket.upload_from_stream(filename, data, metadata=metadata or {})
-        logger.info("GridFS upload", extra={"file_id": str(file_id), "stored_filename": filename})
+        stream: AsyncIOMotorGridIn = self._bucket.open_upload_stream(filename, metadata=metadata or {})
+        written: int = 0
+        try:
+            while chunk := await source.read(_UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if max_bytes is not None and written > max_bytes:
+                    raise UploadTooLargeError(max_bytes)
+                await stream.write(chunk)
+        except BaseException:
+            await stream.abort()
+            raise
+        await stream.close()
+
+        file_id: ObjectId = stream._id
+        logger.info("GridFS upload", extra={"file_id": str(file_id), "stored_filename": filename, "length": written})
         return file_id
 
-    async def download(self, file_id: ObjectId) -> Tuple[bytes, dict[str, Any]]:
-        """Download a file from GridFS.
+    async def open_download_stream(self, file_id: ObjectId) -> AsyncIOMotorGridOut:
+        """Open a GridFS file for chunked reading.
+
+        The returned stream exposes `filename`, `length` and `metadata` and can be
+        consumed with `iter_chunks` without buffering the whole file.
 
         Args:
             file_id: GridFS ObjectId.
 
         Returns:
-            tuple[bytes, dict[str, Any]]: (content, info) where info contains filename/length/metadata.
+            AsyncIOMotorGridOut: Open download stream.
         """
-        stream: AsyncIOMotorGridOut = await self._bucket.open_download_stream(file_id)
-
-        chunks: list[bytes] = []
-        while True:
-            chunk: bytes = await stream.readchunk()
-            if not chunk:
-                break
-            chunks.append(bytes(chunk))
-
-        content: bytes  = b"".join(chunks)
-        info: dict[str, Any] = {
-            "filename": getattr(stream, "filename", None),
-            "length": getattr(stream, "length", None),
-            "metadata": getattr(stream, "metadata", None) or {},
-        }
-        return content, info
+        return await self._bucket.open_download_stream(file_id)
 
     async def delete(self, file_id: ObjectId) -> None:
         """Delete a file from GridFS.
@@ -76,3 +106,24 @@ class GridFsService:
         """
         await self._bucket.delete(file_id)
         logger.info("GridFS delete", extra={"file_id": str(file_id)})
+
+
+async def iter_chunks(stream: AsyncIOMotorGridOut, limit: Optional[int] = None) -> AsyncIterator[bytes]:
+    """Yield a GridFS file chunk by chunk from its current position.
+
+    Args:
+        stream: Open GridFS download stream (optionally positioned with `seek`).
+        limit: Maximum number of bytes to yield; None reads to the end.
+
+    Yields:
+        bytes: Next stored chunk (GridFS chunk size, 255 KiB by default).
+    """
+    remaining: Optional[int] = limit
+    while remaining is None or remaining > 0:
+        chunk: bytes = await stream.readchunk()
+        if not chunk:
+            break
+        if remaining is not None:
+            chunk = chunk[:remaining]
+            remaining -= len(chunk)
+        yield chunk
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Optional
 
@@ -17,16 +18,38 @@ _db: Optional[AsyncIOMotorDatabase[Any]] = None
 def get_client() -> AsyncIOMotorClient[Any]:
     """Return a singleton MongoDB client.
 
+    The connection pool is sized from settings so concurrent requests neither
+    starve on the default pool nor open connections without bound.
+
     Returns:
         AsyncIOMotorClient: MongoDB client.
     """
     global _client
     if _client is None:
         logger.info("Connecting to MongoDB", extra={"mongodb_uri": settings.mongodb_uri})
-        _client = AsyncIOMotorClient(settings.mongodb_uri)
+        _client = AsyncIOMotorClient(
+            settings.mongodb_uri,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            maxIdleTimeMS=settings.mongodb_max_idle_ms,
+            waitQueueTimeoutMS=settings.mongodb_wait_queue_timeout_ms,
+            serverSelectionTimeoutMS=settings.mongodb_server_selection_timeout_ms,
+            retryWrites=True,
+            compressors=settings.mongodb_compressors or None,
+            uuidRepresentation="standard",
+        )
     return _client
 
 
+def close_client() -> None:
+    """Close the singleton MongoDB client (if created) and drop cached handles."""
+    global _client, _db
+    if _client is not None:
+        _client.close()
+    _client = None
+    _db = None
+
+
 def get_db() -> AsyncIOMotorDatabase[Any]:
     """Return a singleton database handle.
 
@@ -53,3 +76,13 @@ async def ping_db() -> bool:
     ok: bool = bool(res.get("ok"))
     logger.info("MongoDB ping", extra={"ok": ok, "db": settings.mongodb_db})
     return ok
+
+
+async def prewarm_pool() -> None:
+    """Open `mongodb_min_pool_size` connections up front.
+
+    The pings run concurrently, so each one checks out its own connection and the
+    first requests after startup do not pay the connection handshake.
+    """
+    client: AsyncIOMotorClient[Any] = get_client()
+    await asyncio.gather(*(client.admin.command("ping") for _ in range(settings.mongodb_min_pool_size)))
@@ -9,6 +9,13 @@ class UserRole(str, Enum):
     ADMINISTRATOR = "ADMINISTRATOR"
 
 
+# Module-level aliases of the role members. Enum members are singletons, so hot
+# paths can compare roles with `is` instead of going through `__eq__`.
+CUSTOMER: UserRole = UserRole.CUSTOMER
+TRANSLATOR: UserRole = UserRole.TRANSLATOR
+ADMIN: UserRole = UserRole.ADMINISTRATOR
+
+
 class ProjectState(str, Enum):
     CREATED = "CREATED"
     ASSIGNED = "ASSIGNED"
@@ -16,3 +23,7 @@ class ProjectState(str, Enum):
     APPROVED = "APPROVED"
     CLOSED = "CLOSED"
 
+
+# Project states that count toward a translator's load. Listed explicitly so queries
+# can use `$in` (index-friendly) instead of `$ne: "CLOSED"`.
+ACTIVE_STATES: tuple[str, ...] = tuple(s.value for s in ProjectState if s is not ProjectState.CLOSED)
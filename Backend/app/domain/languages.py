@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+# All ISO 639-1 two-letter language codes, lower-case. Built once at import so request
+# validation is a single set lookup.
+SUPPORTED_LANGS: frozenset[str] = frozenset(
+    """
+    aa ab ae af ak am an ar as av ay az ba be bg bi bm bn bo br bs ca ce ch co cr cs cu cv cy
+    da de dv dz ee el en eo es et eu fa ff fi fj fo fr fy ga gd gl gn gu gv ha he hi ho hr ht
+    hu hy hz ia id ie ig ii ik io is it iu ja jv ka kg ki kj kk kl km kn ko kr ks ku kv kw ky
+    la lb lg li ln lo lt lu lv mg mh mi mk ml mn mr ms mt my na nb nd ne ng nl nn no nr nv ny
+    oc oj om or os pa pi pl ps pt qu rm rn ro ru rw sa sc sd se sg si sk sl sm sn so sq sr ss
+    st su sv sw ta te tg th ti tk tl tn to tr ts tt tw ty ug uk ur uz ve vi vo wa wo xh yi yo
+    za zh zu
+    """.split()
+)
+
+
+def normalize_language_code(value: str) -> str:
+    """Lower-case a language code and check it is a supported ISO 639-1 code.
+
+    Args:
+        value: Language code as received.
+
+    Returns:
+        str: Lower-case language code.
+
+    Raises:
+        ValueError: If the code is not a supported ISO 639-1 code.
+    """
+    code: str = value.lower()
+    if code not in SUPPORTED_LANGS:
+        raise ValueError(f"Unsupported language code: {value!r}")
+    return code
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Annotated, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, Field
 
 from app.domain.enums import ProjectState, UserRole
+from app.domain.languages import normalize_language_code
+
+
+# Syntactic email check run by pydantic-core's regex engine. Deliverability is not
+# checked, so the heavier `email-validator` parsing (EmailStr) is not needed.
+EMAIL_PATTERN: str = r"^[^@\s]{1,64}@[^@\s]{1,189}\.[A-Za-z]{2,}$"
+
+EmailAddress = Annotated[str, Field(max_length=254, pattern=EMAIL_PATTERN)]
+
+# Request-boundary language code: lower-cased and checked against `SUPPORTED_LANGS` once,
+# so services and repositories can use it as-is.
+LanguageCode = Annotated[
+    str, Field(min_length=2, max_length=2, description="ISO 639-1"), AfterValidator(normalize_language_code)
+]
 
 
 def utc_now() -> datetime:
@@ -33,7 +47,9 @@ class User(BaseModel):
 
     id: UUID
     name: str
-    email_address: EmailStr
+    # Plain str: addresses accepted by the former EmailStr check must keep loading;
+    # `EmailAddress` is only enforced on input models.
+    email_address: str
     role: UserRole
 
     password_hash: str = Field(min_length=1, description="Hash hesla.")
@@ -82,6 +98,7 @@ class Project(BaseModel):
         translator_id: Translator UUID (nullable until assigned).
         language_code: Target language (ISO 639-1).
         original_file_id: GridFS ObjectId (string) for the original uploaded file.
+        original_file_name: Uploaded filename, denormalized so listings need no GridFS lookup.
         translated_file_id: GridFS ObjectId (string) for the translated file (nullable).
         state: Project state machine value.
         created_at: UTC timestamp.
@@ -94,9 +111,20 @@ class Project(BaseModel):
     language_code: str = Field(min_length=2, max_length=2, description="ISO 639-1")
 
     original_file_id: str
+    original_file_name: Optional[str] = None
     translated_file_id: Optional[str] = None
 
     state: ProjectState = ProjectState.CREATED
     created_at: datetime = Field(default_factory=utc_now)
 
     feedback_id: Optional[UUID] = None
+
+    @property
+    def state_str(self) -> str:
+        """Project state as its plain string value."""
+        return self.state.value
+
+    @property
+    def created_at_iso(self) -> str:
+        """Creation timestamp formatted as ISO 8601."""
+        return self.created_at.isoformat()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
@@ -9,11 +11,18 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.auth import router as auth_router
+from app.api.compression import FILE_DOWNLOAD_PATHS, SelectiveGZipMiddleware
+from app.api.deps import clear_shared
 from app.api.feedback import router as feedback_router
 from app.api.health import router as health_router
 from app.api.projects import router as projects_router
 from app.api.users import router as users_router
-from app.db.mongo import ping_db
+from app.db.mongo import close_client, get_db, ping_db, prewarm_pool
+from app.repositories.feedback import FeedbackRepository
+from app.repositories.projects import ProjectRepository
+from app.repositories.translator_languages import TranslatorLanguageRepository
+from app.repositories.users import UserRepository
+from app.services.emailer import EmailService
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,7 +34,13 @@ logging.basicConfig(
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """FastAPI lifespan handler.
 
-    Ensures MongoDB is reachable during application startup.
+    Ensures MongoDB is reachable, pre-opens the connection pool and makes sure all
+    collection indexes exist during application startup (request handlers never
+    create indexes). Also installs a bounded default executor used for CPU-bound
+    work (password hashing, OTP verification) offloaded via `asyncio.to_thread`.
+    On shutdown the shared mailer's SMTP connection is closed and the shared
+    repositories/services are dropped before the client is closed, so a later
+    lifespan in the same process starts from a fresh client.
 
     Args:
         app: FastAPI application.
@@ -34,8 +49,30 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         None
     """
 
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) * 2),
+        thread_name_prefix="piae-worker",
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+
     await ping_db()
-    yield
+    await prewarm_pool()
+    db = get_db()
+    await asyncio.gather(
+        UserRepository(db).ensure_indexes(),
+        ProjectRepository(db).ensure_indexes(),
+        FeedbackRepository(db).ensure_indexes(),
+        TranslatorLanguageRepository(db).ensure_indexes(),
+    )
+    try:
+        yield
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        mailer: EmailService | None = getattr(app.state, "mailer", None)
+        if mailer is not None:
+            await mailer.close()
+        clear_shared(app)
+        close_client()
 
 
 # FastAPI application instance.
@@ -53,6 +90,15 @@ if _cors:
         allow_headers=["*"],
     )
 
+# Compress larger JSON bodies (project lists); small responses and file downloads are
+# sent as-is.
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    exclude_paths=FILE_DOWNLOAD_PATHS,
+    minimum_size=1024,
+    compresslevel=5,
+)
+
 app.include_router(health_router)
 app.include_router(auth_router)
 app.include_router(users_router)
@@ -63,8 +63,6 @@ class FeedbackRepository:
             Feedback: The stored feedback (with final id).
         """
 
-        await self.ensure_indexes()
-
         existing: Feedback | None = await self.get_by_project_id(feedback.project_id)
         if existing is not None:
             feedback = feedback.model_copy(update={"id": existing.id})
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional
+from typing import Any, Mapping, Optional, Tuple
 from uuid import UUID
 
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection, AsyncIOMotorCursor, \
     AsyncIOMotorCommandCursor
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from pymongo.results import UpdateResult
 
-from app.domain.models import Project
+from app.domain.enums import ACTIVE_STATES
+from app.domain.models import Feedback, Project
 
 
 class ProjectRepository:
@@ -33,11 +35,19 @@ class ProjectRepository:
         Notes:
             Safe to call multiple times.
         """
-        await self._col.create_index("id", unique=True)
-        await self._col.create_index("customer_id")
-        await self._col.create_index("translator_id")
-        await self._col.create_index("state")
-        await self._col.create_index("created_at")
+        await self._col.create_indexes(
+            [
+                IndexModel([("id", ASCENDING)], unique=True),
+                # Customer list: filter by customer, newest first.
+                IndexModel([("customer_id", ASCENDING), ("created_at", DESCENDING)]),
+                # Translator list / load counting: filter by translator and state, newest first.
+                IndexModel([("translator_id", ASCENDING), ("state", ASCENDING), ("created_at", DESCENDING)]),
+                # Admin list: optional state filter, newest first.
+                IndexModel([("state", ASCENDING), ("created_at", DESCENDING)]),
+                IndexModel([("created_at", ASCENDING)]),
+                IndexModel([("feedback_id", ASCENDING)], partialFilterExpression={"feedback_id": {"$exists": True}}),
+            ]
+        )
 
     async def create(self, project: Project) -> Project:
         """Insert a new project.
@@ -63,6 +73,38 @@ class ProjectRepository:
         doc: Mapping[str, Any] | None = await self._col.find_one({"id": str(project_id)})
         return Project.model_validate(doc) if doc else None
 
+    async def get_with_feedback(self, project_id: UUID) -> Optional[Tuple[Project, Optional[Feedback]]]:
+        """Fetch a project together with its feedback in a single round trip.
+
+        Args:
+            project_id: Project UUID.
+
+        Returns:
+            tuple[Project, Feedback | None] | None: Project and its feedback (if any),
+            or None if the project does not exist.
+        """
+        pipeline: list[Mapping[str, Any]] = [
+            {"$match": {"id": str(project_id)}},
+            {"$limit": 1},
+            {
+                "$lookup": {
+                    "from": "feedbacks",
+                    "localField": "id",
+                    "foreignField": "project_id",
+                    "as": "feedback_docs",
+                }
+            },
+        ]
+        cursor: AsyncIOMotorCommandCursor[Mapping[str, Any]] = self._col.aggregate(pipeline)
+        docs: list[Mapping[str, Any]] = await cursor.to_list(length=1)
+        if not docs:
+            return None
+
+        doc: Mapping[str, Any] = docs[0]
+        fb_docs: list[Mapping[str, Any]] = doc.get("feedback_docs") or []
+        feedback: Feedback | None = Feedback.model_validate(fb_docs[0]) if fb_docs else None
+        return Project.model_validate(doc), feedback
+
     async def list_by_customer(self, customer_id: UUID) -> list[Project]:
         """List projects created by a customer.
 
@@ -72,9 +114,146 @@ class ProjectRepository:
         Returns:
             list[Project]: Projects sorted by created_at DESC.
         """
-        cursor: AsyncIOMotorCursor[Mapping[str, Any]]= self._col.find({"customer_id": str(customer_id)}).sort("created_at", -1)
+        cursor: AsyncIOMotorCursor[Mapping[str, Any]] = self._col.find(
+            {"customer_id": str(customer_id)}, limit=200, batch_size=200
+        ).sort("created_at", -1)
+        return [Project.model_validate(d) async for d in cursor]
+
+    async def _list_with_user_names(
+        self,
+        query: Mapping[str, Any],
+        user_field: str,
+    ) -> list[Tuple[Project, Optional[str]]]:
+        """List projects joined with a related user's name.
+
+        Args:
+            query: Project filter.
+            user_field: Project field holding the related user id (`customer_id` or `translator_id`).
+
+        Returns:
+            list[tuple[Project, str | None]]: Rows of (project, related user name), sorted by created_at DESC.
+        """
+        pipeline: list[Mapping[str, Any]] = [
+            {"$match": query},
+            {"$sort": {"created_at": -1}},
+            {"$limit": 200},
+            {
+                "$lookup": {
+                    "from": "users",
+                    "localField": user_field,
+                    "foreignField": "id",
+                    "pipeline": [{"$project": {"_id": 0, "name": 1}}],
+                    "as": "user_docs",
+                }
+            },
+            {"$addFields": {"user_name": {"$arrayElemAt": ["$user_docs.name", 0]}}},
+            {"$project": {"_id": 0, "user_docs": 0}},
+        ]
+        # batchSize covers the $limit so the whole page arrives without a getMore.
+        cursor: AsyncIOMotorCommandCursor[Mapping[str, Any]] = self._col.aggregate(pipeline, batchSize=200)
         docs: list[Mapping[str, Any]] = await cursor.to_list(length=200)
-        return [Project.model_validate(d) for d in docs]
+        return [(Project.model_validate(d), d.get("user_name")) for d in docs]
+
+    async def list_by_customer_with_translator_names(self, customer_id: UUID) -> list[Tuple[Project, Optional[str]]]:
+        """List a customer's projects with translator names (one round trip).
+
+        Args:
+            customer_id: Customer UUID.
+
+        Returns:
+            list[tuple[Project, str | None]]: Rows of (project, translator name), sorted by created_at DESC.
+        """
+        return await self._list_with_user_names({"customer_id": str(customer_id)}, "translator_id")
+
+    async def list_by_translator_with_customer_names(
+        self, translator_id: UUID, *, include_closed: bool = False
+    ) -> list[Tuple[Project, Optional[str]]]:
+        """List a translator's projects with customer names (one round trip).
+
+        Args:
+            translator_id: Translator UUID.
+            include_closed: Whether to include CLOSED projects.
+
+        Returns:
+            list[tuple[Project, str | None]]: Rows of (project, customer name), sorted by created_at DESC.
+        """
+        query: dict[str, Any] = {"translator_id": str(translator_id)}
+        if not include_closed:
+            query["state"] = {"$in": list(ACTIVE_STATES)}
+        return await self._list_with_user_names(query, "customer_id")
+
+    async def list_with_feedback_joined(self, state: Optional[str] = None) -> list[Mapping[str, Any]]:
+        """List projects that have feedback, joined with user details and feedback text.
+
+        Customer, translator and feedback are resolved server-side with `$lookup`, so
+        the whole listing is a single round trip.
+
+        Args:
+            state: Optional state filter.
+
+        Returns:
+            list[Mapping[str, Any]]: Raw rows with project fields plus `customer_name`,
+            `customer_email`, `translator_name`, `translator_email` and `feedback_text`,
+            sorted by created_at DESC.
+        """
+        query: dict[str, Any] = {
+            "$or": [{"feedback_id": {"$exists": True, "$ne": None}}, {"feedback": {"$ne": None}}]
+        }
+        if state:
+            query["state"] = state
+
+        user_fields: list[Mapping[str, Any]] = [{"$project": {"_id": 0, "name": 1, "email_address": 1}}]
+        pipeline: list[Mapping[str, Any]] = [
+            {"$match": query},
+            {"$sort": {"created_at": -1}},
+            {"$limit": 200},
+            {
+                "$lookup": {
+                    "from": "users",
+                    "localField": "customer_id",
+                    "foreignField": "id",
+                    "pipeline": user_fields,
+                    "as": "cu",
+                }
+            },
+            {
+                "$lookup": {
+                    "from": "users",
+                    "localField": "translator_id",
+                    "foreignField": "id",
+                    "pipeline": user_fields,
+                    "as": "tu",
+                }
+            },
+            {
+                "$lookup": {
+                    "from": "feedbacks",
+                    "localField": "id",
+                    "foreignField": "project_id",
+                    "pipeline": [{"$project": {"_id": 0, "text": 1}}],
+                    "as": "fb",
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "id": 1,
+                    "language_code": 1,
+                    "state": 1,
+                    "customer_id": 1,
+                    "translator_id": 1,
+                    "created_at": 1,
+                    "customer_name": {"$arrayElemAt": ["$cu.name", 0]},
+                    "customer_email": {"$arrayElemAt": ["$cu.email_address", 0]},
+                    "translator_name": {"$arrayElemAt": ["$tu.name", 0]},
+                    "translator_email": {"$arrayElemAt": ["$tu.email_address", 0]},
+                    # Older documents embedded the feedback on the project itself.
+                    "feedback_text": {"$ifNull": [{"$arrayElemAt": ["$fb.text", 0]}, "$feedback.text"]},
+                }
+            },
+        ]
+        cursor: AsyncIOMotorCommandCursor[Mapping[str, Any]] = self._col.aggregate(pipeline, batchSize=200)
+        return await cursor.to_list(length=200)
 
     async def assign_translator(self, project_id: UUID, translator_id: UUID, state: str) -> None:
         """Assign a translator to a project and update project state.
@@ -97,6 +276,23 @@ class ProjectRepository:
         """
         await self._col.update_one({"id": str(project_id)}, {"$set": {"state": "CLOSED"}})
 
+    async def bulk_close(self, project_ids: list[UUID]) -> int:
+        """Mark multiple projects as CLOSED in one write.
+
+        Args:
+            project_ids: Project UUIDs.
+
+        Returns:
+            int: Number of projects whose state changed.
+        """
+        if not project_ids:
+            return 0
+        res: UpdateResult = await self._col.update_many(
+            {"id": {"$in": [str(p) for p in project_ids]}, "state": {"$ne": "CLOSED"}},
+            {"$set": {"state": "CLOSED"}},
+        )
+        return res.modified_count
+
     async def list_by_translator(self, translator_id: UUID, *, include_closed: bool = False) -> list[Project]:
         """List projects assigned to a translator.
 
@@ -109,40 +305,11 @@ class ProjectRepository:
         """
         query: dict[str, Any] = {"translator_id": str(translator_id)}
         if not include_closed:
-            query["state"] = {"$ne": "CLOSED"}
-        cursor: AsyncIOMotorCursor[Mapping[str, Any]] = self._col.find(query).sort("created_at", -1)
-        docs: list[Mapping[str, Any]] = await cursor.to_list(length=200)
-        return [Project.model_validate(d) for d in docs]
-
-    async def count_active_by_translator_ids(self, translator_ids: list[UUID]) -> dict[str, int]:
-        """Count non-CLOSED projects for multiple translators.
-
-        Args:
-            translator_ids: Translator UUIDs.
-
-        Returns:
-            dict[str, int]: Mapping {translator_id: active_project_count}.
-        """
-        if not translator_ids:
-            return {}
-
-        ids: list[str] = [str(t) for t in translator_ids]
-        pipeline: list[Mapping[str, Any]] = [
-            {
-                "$match": {
-                    "translator_id": {"$in": ids},
-                    "state": {"$ne": "CLOSED"},
-                }
-            },
-            {"$group": {"_id": "$translator_id", "count": {"$sum": 1}}},
-        ]
-        cursor: AsyncIOMotorCommandCursor[Mapping[str, Any]] = self._col.aggregate(pipeline)
-        docs: list[Mapping[str, Any]] = await cursor.to_list(length=len(ids))
-
-        counts: dict[str, int] = {str(t): 0 for t in translator_ids}
-        for d in docs:
-            counts[str(d.get("_id"))] = int(d.get("count") or 0)
-        return counts
+            query["state"] = {"$in": list(ACTIVE_STATES)}
+        cursor: AsyncIOMotorCursor[Mapping[str, Any]] = self._col.find(query, limit=200, batch_size=200).sort(
+            "created_at", -1
+        )
+        return [Project.model_validate(d) async for d in cursor]
 
     async def submit_translation(self, *, project_id: UUID, translator_id: UUID, translated_file_id: str) -> bool:
         """Attach translated file id and switch state to COMPLETED.
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping, Optional, Tuple
+from uuid import UUID
 
-from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection, AsyncIOMotorCursor
+from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection, AsyncIOMotorCommandCursor
+from pymongo import UpdateOne
+from pymongo.results import BulkWriteResult, DeleteResult
 
+from app.domain.enums import ACTIVE_STATES, UserRole
 from app.domain.models import TranslatorLanguage
 
 
@@ -27,24 +31,61 @@ class TranslatorLanguageRepository:
             db: Motor database handle.
         """
         self._col: AsyncIOMotorCollection[Mapping[str, Any]] = db["translator_languages"]
+        self._users: AsyncIOMotorCollection[Mapping[str, Any]] = db["users"]
 
     async def ensure_indexes(self) -> None:
         """Create MongoDB indexes required by the application."""
         await self._col.create_index([("translator_id", 1), ("language_code", 1)], unique=True)
         await self._col.create_index("language_code")
 
-    async def list_translator_ids_for_language(self, language_code: str) -> list[str]:
-        """List translator ids configured for a given language.
+    async def find_least_loaded_translator(self, language_code: str) -> Optional[UUID]:
+        """Pick the translator for a language with the fewest active (non-CLOSED) projects.
+
+        Candidate lookup and load counting run as one aggregation: each
+        translator_languages row joins a count of that translator's active projects.
+        Ties are broken by insertion order of the language rows.
 
         Args:
             language_code: ISO 639-1 code.
 
         Returns:
-            list[str]: Translator ids as strings.
+            UUID | None: Chosen translator id, or None if no translator supports the language.
         """
-        cursor: AsyncIOMotorCursor[Mapping[str, Any]] = self._col.find({"language_code": language_code}, projection={"translator_id": 1})
-        docs: list[Mapping[str, Any]] = await cursor.to_list(length=10000)
-        return [d["translator_id"] for d in docs]
+        pipeline: list[Mapping[str, Any]] = [
+            {"$match": {"language_code": language_code}},
+            {
+                "$lookup": {
+                    "from": "projects",
+                    "localField": "translator_id",
+                    "foreignField": "translator_id",
+                    "pipeline": [
+                        {"$match": {"state": {"$in": list(ACTIVE_STATES)}}},
+                        {"$count": "c"},
+                    ],
+                    "as": "active",
+                }
+            },
+            {
+                "$project": {
+                    "translator_id": 1,
+                    "load": {"$ifNull": [{"$arrayElemAt": ["$active.c", 0]}, 0]},
+                }
+            },
+            {"$sort": {"load": 1, "_id": 1}},
+            {"$limit": 1},
+        ]
+        # Pin the language_code index for the candidate $match; the inner $lookup match
+        # is served by the projects (translator_id, state, created_at) index.
+        cursor: AsyncIOMotorCommandCursor[Mapping[str, Any]] = self._col.aggregate(
+            pipeline,
+            hint=[("language_code", 1)],
+            # $limit 1 leaves a single row, so one batch always suffices.
+            batchSize=1,
+            # Bound the tail latency of project creation on a slow plan.
+            maxTimeMS=1000,
+        )
+        docs: list[Mapping[str, Any]] = await cursor.to_list(length=1)
+        return UUID(docs[0]["translator_id"]) if docs else None
 
     async def list_languages_for_translator(self, translator_id: str) -> list[str]:
         """List language codes configured for a translator.
@@ -53,11 +94,60 @@ class TranslatorLanguageRepository:
             translator_id: Translator UUID as string.
 
         Returns:
-            list[str]: Language codes.
+            list[str]: Distinct language codes.
+        """
+        return await self._col.distinct("language_code", {"translator_id": translator_id})
+
+    async def get_translator_with_languages(self, translator_id: UUID) -> Optional[Tuple[UserRole, list[str]]]:
+        """Fetch a user's role together with their configured languages (one round trip).
+
+        Args:
+            translator_id: Translator UUID.
+
+        Returns:
+            tuple[UserRole, list[str]] | None: (role, lowercase language codes sorted and
+            deduplicated), or None if the user does not exist.
         """
-        cursor: AsyncIOMotorCursor[Mapping[str, Any]] = self._col.find({"translator_id": translator_id}, projection={"language_code": 1})
-        docs: list[Mapping[str, Any]] = await cursor.to_list(length=10000)
-        return [d["language_code"] for d in docs]
+        pipeline: list[Mapping[str, Any]] = [
+            {"$match": {"id": str(translator_id)}},
+            {"$limit": 1},
+            {
+                "$lookup": {
+                    "from": "translator_languages",
+                    "localField": "id",
+                    "foreignField": "translator_id",
+                    "pipeline": [{"$project": {"_id": 0, "language_code": 1}}],
+                    "as": "langs",
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "role": 1,
+                    # Lowercase, dedupe ($setUnion) and sort server-side; requires MongoDB >= 5.2.
+                    "langs": {
+                        "$sortArray": {
+                            "input": {
+                                "$setUnion": [
+                                    {
+                                        "$map": {
+                                            "input": "$langs.language_code",
+                                            "in": {"$toLower": "$$this"},
+                                        }
+                                    }
+                                ]
+                            },
+                            "sortBy": 1,
+                        }
+                    },
+                }
+            },
+        ]
+        cursor: AsyncIOMotorCommandCursor[Mapping[str, Any]] = self._users.aggregate(pipeline)
+        docs: list[Mapping[str, Any]] = await cursor.to_list(length=1)
+        if not docs:
+            return None
+        return UserRole(docs[0]["role"]), docs[0]["langs"]
 
     async def add_language(self, tl: TranslatorLanguage) -> None:
         """Add a translator language if it does not exist (idempotent).
@@ -71,11 +161,45 @@ class TranslatorLanguageRepository:
             upsert=True,
         )
 
-    async def delete_language(self, *, translator_id: str, language_code: str) -> None:
+    async def add_languages(self, translator_id: UUID, language_codes: Iterable[str]) -> int:
+        """Add several translator languages with one unordered bulk write (idempotent).
+
+        Args:
+            translator_id: Translator UUID.
+            language_codes: ISO 639-1 codes (already normalized).
+
+        Returns:
+            int: Number of languages that were not present before.
+        """
+        ops: list[UpdateOne] = [
+            UpdateOne(
+                {"translator_id": str(translator_id), "language_code": code},
+                {
+                    "$setOnInsert": TranslatorLanguage(
+                        translator_id=translator_id,
+                        language_code=code,
+                    ).model_dump(mode="json")
+                },
+                upsert=True,
+            )
+            for code in language_codes
+        ]
+        if not ops:
+            return 0
+        result: BulkWriteResult = await self._col.bulk_write(ops, ordered=False)
+        return result.upserted_count
+
+    async def delete_language(self, *, translator_id: str, language_code: str) -> bool:
         """Remove a translator language.
 
         Args:
             translator_id: Translator UUID as string.
             language_code: ISO 639-1 code.
+
+        Returns:
+            bool: True if a language was removed.
         """
-        await self._col.delete_one({"translator_id": translator_id, "language_code": language_code})
+        result: DeleteResult = await self._col.delete_one(
+            {"translator_id": translator_id, "language_code": language_code}
+        )
+        return result.deleted_count > 0
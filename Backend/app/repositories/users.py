@@ -1,13 +1,48 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Mapping
+import time
+from typing import Any, Iterable, Optional, Mapping
 from uuid import UUID
 
+from cachetools import TLRUCache, TTLCache
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection, AsyncIOMotorCursor
+from pymongo import UpdateOne
+from pymongo.results import BulkWriteResult
 
+from app.core.config import settings
 from app.domain.enums import UserRole
 from app.domain.models import User
 
+_MISSING: object = object()
+_BY_NAME_TTL_SECONDS: float = 10.0
+# Negative lookups expire sooner so a freshly registered name becomes visible quickly
+# and unknown-name probes cannot pin entries for long.
+_BY_NAME_NEGATIVE_TTL_SECONDS: float = 2.0
+
+# Process-wide username -> user cache shared by all repository instances (login paths).
+_by_name_cache: TLRUCache[str, Optional[User]] = TLRUCache(
+    maxsize=4096,
+    ttu=lambda _name, user, now: now + (_BY_NAME_TTL_SECONDS if user is not None else _BY_NAME_NEGATIVE_TTL_SECONDS),
+    timer=time.monotonic,
+)
+
+_BY_ID_TTL_SECONDS: float = settings.user_cache_ttl_seconds
+
+# Process-wide id -> user cache for authorization lookups. Only hits are cached.
+_by_id_cache: TTLCache[UUID, User] = TTLCache(maxsize=10_000, ttl=_BY_ID_TTL_SECONDS, timer=time.monotonic)
+
+
+def _invalidate_cached_user(user_id: UUID) -> None:
+    """Drop id and username cache entries for the given user id.
+
+    Args:
+        user_id: User UUID.
+    """
+    _by_id_cache.pop(user_id, None)
+    for name, user in list(_by_name_cache.items()):
+        if user is not None and user.id == user_id:
+            _by_name_cache.pop(name, None)
+
 
 class UserRepository:
     """MongoDB repository for users.
@@ -40,14 +75,44 @@ class UserRepository:
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Fetch a user by id.
 
+        Found users are cached for a short time; updates made through this
+        repository invalidate the entry.
+
         Args:
             user_id: User UUID.
 
         Returns:
             User | None: Loaded user or None if not found.
         """
+        user: User | None = _by_id_cache.get(user_id)
+        if user is not None:
+            return user
+
         doc: Mapping[str, Any] | None = await self._col.find_one({"id": str(user_id)})
-        return User.model_validate(doc) if doc else None
+        if not doc:
+            return None
+        user = User.model_validate(doc)
+        _by_id_cache[user_id] = user
+        return user
+
+    async def get_role(self, user_id: UUID) -> Optional[UserRole]:
+        """Fetch only a user's role.
+
+        Served from the id cache when possible; otherwise only the `role` field is
+        loaded, without building a `User`.
+
+        Args:
+            user_id: User UUID.
+
+        Returns:
+            UserRole | None: Role, or None if the user does not exist.
+        """
+        user: User | None = _by_id_cache.get(user_id)
+        if user is not None:
+            return user.role
+
+        doc: Mapping[str, Any] | None = await self._col.find_one({"id": str(user_id)}, projection={"_id": 0, "role": 1})
+        return UserRole(doc["role"]) if doc else None
 
     async def get_by_email(self, email_address: str) -> Optional[User]:
         """Fetch a user by email.
@@ -64,14 +129,23 @@ class UserRepository:
     async def get_by_name(self, name: str) -> Optional[User]:
         """Fetch a user by username.
 
+        Results (including misses) are cached for a few seconds to absorb repeated
+        login attempts for the same name.
+
         Args:
             name: Alphanumeric username.
 
         Returns:
             User | None: Loaded user or None if not found.
         """
+        cached: User | None | object = _by_name_cache.get(name, _MISSING)
+        if cached is not _MISSING:
+            return cached  # type: ignore[return-value]
+
         doc: Mapping[str, Any] | None = await self._col.find_one({"name": name})
-        return User.model_validate(doc) if doc else None
+        user: User | None = User.model_validate(doc) if doc else None
+        _by_name_cache[name] = user
+        return user
 
     async def create(self, user: User) -> User:
         """Persist a new user.
@@ -86,35 +160,30 @@ class UserRepository:
             Any: Propagates underlying Motor/Mongo exceptions (e.g., duplicate key).
         """
         await self._col.insert_one(user.model_dump(mode="json"))
+        _by_name_cache.pop(user.name, None)
+        _by_id_cache.pop(user.id, None)
         return user
 
-    async def list_by_ids(self, user_ids: list[UUID]) -> list[User]:
-        """Load multiple users by ids.
-
-        Args:
-            user_ids: List of user UUIDs.
-
-        Returns:
-            list[User]: Users found for the given ids.
-        """
-        if not user_ids:
-            return []
-        ids: list[str] = [str(x) for x in user_ids]
-        cursor: AsyncIOMotorCursor[Mapping[str, Any]] = self._col.find({"id": {"$in": ids}})
-        docs: list[Mapping[str, Any]] = await cursor.to_list(length=len(ids))
-        return [User.model_validate(d) for d in docs]
-
-    async def map_ids_to_names(self, user_ids: list[UUID]) -> dict[str, str]:
-        """Create an id->username mapping for a list of user ids.
+    async def upsert_many(self, users: Iterable[User]) -> int:
+        """Insert or overwrite multiple users (matched by id) in one bulk write.
 
         Args:
-            user_ids: List of user UUIDs.
+            users: User models.
 
         Returns:
-            dict[str, str]: Mapping {user_id: username}.
+            int: Number of users that did not exist before.
         """
-        users: list[User] = await self.list_by_ids(user_ids)
-        return {str(u.id): u.name for u in users}
+        batch: list[User] = list(users)
+        if not batch:
+            return 0
+        ops: list[UpdateOne] = [
+            UpdateOne({"id": str(u.id)}, {"$set": u.model_dump(mode="json")}, upsert=True) for u in batch
+        ]
+        result: BulkWriteResult = await self._col.bulk_write(ops, ordered=False)
+        for u in batch:
+            _invalidate_cached_user(u.id)
+            _by_name_cache.pop(u.name, None)
+        return result.upserted_count
 
     async def list_translators_for_language(self, language_code: str) -> list[User]:
         """List translators (currently unfiltered) used as a building block.
@@ -125,9 +194,10 @@ class UserRepository:
         Returns:
             list[User]: Translator users.
         """
-        cursor: AsyncIOMotorCursor[Mapping[str, Any]] = self._col.find({"role": UserRole.TRANSLATOR.value})
-        docs: list[Mapping[str, Any]] = await cursor.to_list(length=1000)
-        return [User.model_validate(d) for d in docs]
+        cursor: AsyncIOMotorCursor[Mapping[str, Any]] = self._col.find(
+            {"role": UserRole.TRANSLATOR.value}, limit=1000, batch_size=200
+        )
+        return [User.model_validate(d) async for d in cursor]
 
     async def enable_otp(self, *, user_id: UUID, otp_secret: str) -> None:
         """Enable OTP authentication for a user.
@@ -140,6 +210,7 @@ class UserRepository:
             {"id": str(user_id)},
             {"$set": {"otp_enabled": True, "otp_secret": otp_secret}},
         )
+        _invalidate_cached_user(user_id)
 
     async def update_password_hash(self, *, user_id: UUID, password_hash: str) -> None:
         """Update stored password hash for a user.
@@ -152,3 +223,4 @@ class UserRepository:
             {"id": str(user_id)},
             {"$set": {"password_hash": password_hash}},
         )
+        _invalidate_cached_user(user_id)
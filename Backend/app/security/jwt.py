@@ -9,6 +9,12 @@ import jwt as jwt_lib
 from app.core.config import settings
 from app.domain.enums import UserRole
 
+# Key material is prepared once; PyJWT's HMAC path (stdlib `hmac`, OpenSSL-backed) then
+# skips the per-call str -> bytes conversion and PEM sniffing of the secret.
+_KEY: bytes = settings.jwt_secret.encode("utf-8")
+# Pinned to the single configured HMAC algorithm so decode never negotiates from the header.
+_ALGORITHMS: list[str] = [settings.jwt_algorithm]
+
 
 def create_access_token(*, user_id: UUID, role: UserRole) -> str:
     """Create a signed JWT access token.
@@ -30,7 +36,7 @@ def create_access_token(*, user_id: UUID, role: UserRole) -> str:
         "exp": int(exp.timestamp()),
     }
 
-    return jwt_lib.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+    return jwt_lib.encode(payload, _KEY, algorithm=_ALGORITHMS[0])
 
 
 def decode_token(token: str) -> dict[str, Any]:
@@ -45,4 +51,4 @@ def decode_token(token: str) -> dict[str, Any]:
     Raises:
         jwt.PyJWTError: If token is invalid or expired.
     """
-    return jwt_lib.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+    return jwt_lib.decode(token, _KEY, algorithms=_ALGORITHMS)
@@ -1,13 +1,106 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
+import math
+import statistics
+import time
 
-from passlib.context import CryptContext
+from argon2 import Parameters, PasswordHasher, extract_parameters, profiles
+from argon2.exceptions import VerifyMismatchError
+
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-_pwd = CryptContext(schemes=["argon2"], deprecated="auto")
+# Security floor: never hash below the RFC 9106 low-memory profile.
+_BASELINE = profiles.RFC_9106_LOW_MEMORY
+_MAX_TIME_COST: int = 32
+
+
+def _measure_ms(hasher: PasswordHasher, *, rounds: int = 3) -> float:
+    """Return the median wall time of hashing a fixed input.
+
+    Args:
+        hasher: Hasher to measure.
+        rounds: Number of samples.
+
+    Returns:
+        float: Median hash time in milliseconds.
+    """
+    samples: list[float] = []
+    for _ in range(rounds):
+        start: float = time.perf_counter()
+        hasher.hash("calibration")
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def _build_hasher(time_cost: int) -> PasswordHasher:
+    """Build an Argon2id hasher with the RFC 9106 low-memory profile and a given time cost.
+
+    Args:
+        time_cost: Number of Argon2 passes (raised to the profile floor if lower).
+
+    Returns:
+        PasswordHasher: Configured hasher.
+    """
+    return PasswordHasher(
+        time_cost=max(time_cost, _BASELINE.time_cost),
+        memory_cost=_BASELINE.memory_cost,
+        parallelism=_BASELINE.parallelism,
+        hash_len=_BASELINE.hash_len,
+        salt_len=_BASELINE.salt_len,
+        type=_BASELINE.type,
+    )
+
+
+def calibrate(target_ms: int | None = None) -> PasswordHasher:
+    """Pick an Argon2id `time_cost` that hits the target hash time on this host.
+
+    Meant to be run offline (see `scripts/calibrate_password_hash.py`); the result is
+    then pinned via `PASSWORD_HASH_TIME_COST` so every worker uses the same cost.
+    Memory cost and parallelism are kept at the RFC 9106 low-memory profile. The
+    per-pass cost is measured once and extrapolated, then `time_cost` is bumped
+    until the measured median reaches the target (capped at `_MAX_TIME_COST`).
+
+    Args:
+        target_ms: Target hash time in milliseconds (defaults to config).
+
+    Returns:
+        PasswordHasher: Calibrated Argon2id hasher.
+    """
+    target: float = float(target_ms if target_ms is not None else settings.password_hash_target_ms)
+
+    # One pass (below the floor on purpose) gives the per-pass cost to extrapolate from.
+    one_pass: PasswordHasher = PasswordHasher(
+        time_cost=1,
+        memory_cost=_BASELINE.memory_cost,
+        parallelism=_BASELINE.parallelism,
+        hash_len=_BASELINE.hash_len,
+        salt_len=_BASELINE.salt_len,
+        type=_BASELINE.type,
+    )
+    per_pass_ms: float = max(_measure_ms(one_pass), 0.1)
+    time_cost: int = min(max(_BASELINE.time_cost, math.ceil(target / per_pass_ms)), _MAX_TIME_COST)
+
+    hasher: PasswordHasher = _build_hasher(time_cost)
+    measured_ms: float = _measure_ms(hasher, rounds=1)
+    while measured_ms < target and time_cost < _MAX_TIME_COST:
+        time_cost += 1
+        hasher = _build_hasher(time_cost)
+        measured_ms = _measure_ms(hasher, rounds=1)
+
+    logger.info(
+        "Argon2id calibrated",
+        extra={"time_cost": time_cost, "memory_cost": _BASELINE.memory_cost, "hash_ms": round(measured_ms, 1)},
+    )
+    return hasher
+
+
+# Process-wide hasher with pinned parameters, identical in every worker.
+_hasher: PasswordHasher = _build_hasher(settings.password_hash_time_cost)
 
 
 def _normalize_password(password: str) -> str:
@@ -31,7 +124,7 @@ def _normalize_password(password: str) -> str:
 
 
 def hash_password(password: str) -> str:
-    """Hash a plaintext password using Argon2.
+    """Hash a plaintext password using the calibrated Argon2id parameters.
 
     Args:
         password: Plaintext password.
@@ -40,7 +133,7 @@ def hash_password(password: str) -> str:
         str: Argon2 hash string.
     """
 
-    return str(_pwd.hash(_normalize_password(password)))
+    return _hasher.hash(_normalize_password(password))
 
 
 def verify_password(password: str, password_hash: str) -> bool:
@@ -55,16 +148,47 @@ def verify_password(password: str, password_hash: str) -> bool:
     """
 
     try:
-        return bool(_pwd.verify(_normalize_password(password), password_hash))
+        return bool(_hasher.verify(password_hash, _normalize_password(password)))
+    except VerifyMismatchError:
+        return False
     except Exception as ex:
         logger.warning("Password verify failed", exc_info=ex)
         return False
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password on a worker thread so the event loop is not blocked.
+
+    Args:
+        password: Plaintext password.
+
+    Returns:
+        str: Argon2 hash string.
+    """
+
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    """Verify a password on a worker thread so the event loop is not blocked.
+
+    Args:
+        password: Plaintext password.
+        password_hash: Stored password hash.
+
+    Returns:
+        bool: True if valid.
+    """
+
+    return await asyncio.to_thread(verify_password, password, password_hash)
+
+
 def needs_rehash(password_hash: str) -> bool:
     """Check whether a stored hash should be re-hashed.
 
-    This becomes relevant if Argon2 parameters change over time.
+    Returns True only when the stored hash is weaker than the configured parameters
+    (other variant, fewer passes, less memory, shorter hash or salt), so old hashes
+    get upgraded on next login but stronger ones are never rewritten downwards.
 
     Args:
         password_hash: Stored password hash.
@@ -74,6 +198,13 @@ def needs_rehash(password_hash: str) -> bool:
     """
 
     try:
-        return bool(_pwd.needs_update(password_hash))
+        stored: Parameters = extract_parameters(password_hash)
     except Exception:
         return False
+    return (
+        stored.type is not _hasher.type
+        or stored.time_cost < _hasher.time_cost
+        or stored.memory_cost < _hasher.memory_cost
+        or stored.hash_len < _hasher.hash_len
+        or stored.salt_len < _hasher.salt_len
+    )
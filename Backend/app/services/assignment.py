@@ -18,6 +18,7 @@ class ProjectAssignmentService:
     - select translators who support `language_code`
     - pick the translator with the lowest number of active (non-CLOSED) projects
     - if multiple translators tie, pick the first one in the repository order
+      (candidate selection and load counting run server-side in one aggregation)
     - if no translator exists, close the project
 
     Args:
@@ -42,23 +43,7 @@ class ProjectAssignmentService:
         Returns:
             UUID | None: Chosen translator id, or None if none is available.
         """
-
-        translator_ids_raw: list[str] = await self._translator_lang_repo.list_translator_ids_for_language(language_code)
-        if not translator_ids_raw:
-            return None
-
-        translator_ids: list[UUID] = [UUID(x) for x in translator_ids_raw]
-        counts: dict[str, int] = await self._project_repo.count_active_by_translator_ids(translator_ids)
-
-        best: Optional[UUID] = None
-        best_count: Optional[int] = None
-        for tid in translator_ids:
-            c = counts.get(str(tid), 0)
-            if best is None or best_count is None or c < best_count:
-                best = tid
-                best_count = c
-
-        return best
+        return await self._translator_lang_repo.find_least_loaded_translator(language_code)
 
     async def assign_or_close(self, project_id: UUID, language_code: str) -> Optional[UUID]:
         """Assign a translator to a project or close it.
@@ -72,13 +57,26 @@ class ProjectAssignmentService:
         """
 
         translator_id: UUID | None = await self.find_best_translator_id(language_code)
+        await self.apply(project_id, translator_id, language_code=language_code)
+        return translator_id
+
+    async def apply(self, project_id: UUID, translator_id: Optional[UUID], *, language_code: str) -> None:
+        """Persist a translator choice: assign it, or close the project when there is none.
+
+        Split from `assign_or_close` so callers can run `find_best_translator_id` early.
+
+        Args:
+            project_id: Project UUID.
+            translator_id: Chosen translator id, or None to close the project.
+            language_code: Target language (ISO 639-1), used for logging.
+        """
         if translator_id is None:
             await self._project_repo.close_project(project_id)
             logger.info(
                 "No translator found; project closed",
                 extra={"project_id": str(project_id), "language_code": language_code},
             )
-            return None
+            return
 
         await self._project_repo.assign_translator(
             project_id=project_id,
@@ -89,4 +87,3 @@ class ProjectAssignmentService:
             "Project assigned",
             extra={"project_id": str(project_id), "translator_id": str(translator_id)},
         )
-        return translator_id
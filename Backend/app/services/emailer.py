@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-import smtplib
 from email.message import EmailMessage
+from typing import Optional
+
+import aiosmtplib
 
 from app.core.config import settings
 
@@ -12,6 +15,11 @@ logger = logging.getLogger(__name__)
 class EmailService:
     """SMTP email sender.
 
+    `send_async` keeps one SMTP connection open and reuses it across messages
+    (serialized by a lock), reconnecting once if the server dropped it; `close`
+    shuts it down.
+    When no SMTP host is configured the service is disabled and sends are no-ops.
+
     Args:
         host: SMTP hostname. Defaults to config.
         port: SMTP port. Defaults to config.
@@ -23,14 +31,25 @@ class EmailService:
         self._host: str = host or settings.smtp_host
         self._port: int = port or settings.smtp_port
         self._from: str = mail_from or settings.smtp_from
+        self._enabled: bool = bool(self._host)
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._lock: asyncio.Lock = asyncio.Lock()
 
-    def send(self, *, to: str, subject: str, text: str) -> None:
-        """Send a plaintext email.
+    @property
+    def enabled(self) -> bool:
+        """Whether an SMTP host is configured."""
+        return self._enabled
+
+    def _build_message(self, *, to: str, subject: str, text: str) -> EmailMessage:
+        """Build a plaintext message and log the send.
 
         Args:
             to: Recipient email.
             subject: Email subject.
             text: Email body.
+
+        Returns:
+            EmailMessage: Message ready to send.
         """
         msg: EmailMessage = EmailMessage()
         msg["From"] = self._from
@@ -42,6 +61,52 @@ class EmailService:
             "Sending email",
             extra={"smtp_host": self._host, "smtp_port": self._port, "to": to, "subject": subject},
         )
+        return msg
+
+    async def _connection(self) -> aiosmtplib.SMTP:
+        """Return the open SMTP connection, connecting if needed.
+
+        Returns:
+            aiosmtplib.SMTP: Connected client.
+        """
+        if self._smtp is None or not self._smtp.is_connected:
+            smtp: aiosmtplib.SMTP = aiosmtplib.SMTP(hostname=self._host, port=self._port, timeout=10)
+            await smtp.connect()
+            self._smtp = smtp
+        return self._smtp
+
+    async def send_async(self, *, to: str, subject: str, text: str) -> None:
+        """Send a plaintext email without blocking the event loop.
+
+        Args:
+            to: Recipient email.
+            subject: Email subject.
+            text: Email body.
+
+        Raises:
+            aiosmtplib.SMTPException: If sending fails after one reconnect.
+        """
+        if not self._enabled:
+            return
+        msg: EmailMessage = self._build_message(to=to, subject=subject, text=text)
+
+        async with self._lock:
+            try:
+                await (await self._connection()).send_message(msg)
+            except aiosmtplib.SMTPServerDisconnected:
+                # Idle connection closed by the server; reconnect once.
+                self._smtp = None
+                await (await self._connection()).send_message(msg)
 
-        with smtplib.SMTP(self._host, self._port, timeout=10) as smtp:
-            smtp.send_message(msg)
+    async def close(self) -> None:
+        """Close the SMTP connection kept open by `send_async`, if any."""
+        async with self._lock:
+            smtp: Optional[aiosmtplib.SMTP] = self._smtp
+            self._smtp = None
+            if smtp is None or not smtp.is_connected:
+                return
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException:
+                # Server already gone; just drop the socket.
+                smtp.close()
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import hmac
 import logging
+import struct
+import time
+from functools import lru_cache
 
 import pyotp
 from pyotp import TOTP
@@ -9,6 +15,8 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+_TOTP_DIGITS: int = 6
+
 
 def generate_secret() -> str:
     """Generate a new base32 secret for TOTP.
@@ -19,8 +27,9 @@ def generate_secret() -> str:
     return pyotp.random_base32()
 
 
+@lru_cache(maxsize=4096)
 def totp_from_secret(secret: str) -> pyotp.TOTP:
-    """Create a TOTP instance from a base32 secret.
+    """Create a TOTP instance from a base32 secret (memoized per secret).
 
     Args:
         secret: Base32 secret.
@@ -31,6 +40,47 @@ def totp_from_secret(secret: str) -> pyotp.TOTP:
     return pyotp.TOTP(secret, interval=settings.otp_interval_seconds)
 
 
+@lru_cache(maxsize=4096)
+def _decode_secret(secret_b32: str) -> bytes:
+    """Decode a base32 TOTP secret into HMAC key bytes (memoized).
+
+    Args:
+        secret_b32: Base32 secret (padding optional).
+
+    Returns:
+        bytes: Decoded key.
+    """
+    padded: str = secret_b32 + "=" * (-len(secret_b32) % 8)
+    return base64.b32decode(padded, casefold=True)
+
+
+def otp_verify(secret_b32: str, code: str) -> bool:
+    """Verify a 6-digit TOTP code using HMAC-SHA1 (RFC 6238).
+
+    The secret is decoded once (cached) and every accepted time step in the
+    configured window is checked with a constant-time comparison.
+
+    Args:
+        secret_b32: Base32 secret.
+        code: Normalized numeric code.
+
+    Returns:
+        bool: True if the code matches any time step in the window.
+    """
+    key: bytes = _decode_secret(secret_b32)
+    counter: int = int(time.time()) // settings.otp_interval_seconds
+    expected: bytes = code.encode("ascii")
+
+    ok: bool = False
+    for offset in range(-settings.otp_valid_window, settings.otp_valid_window + 1):
+        digest: bytes = hmac.new(key, struct.pack(">Q", counter + offset), hashlib.sha1).digest()
+        pos: int = digest[-1] & 0x0F
+        value: int = (struct.unpack(">I", digest[pos:pos + 4])[0] & 0x7FFFFFFF) % 10**_TOTP_DIGITS
+        candidate: bytes = str(value).zfill(_TOTP_DIGITS).encode("ascii")
+        ok |= hmac.compare_digest(candidate, expected)
+    return ok
+
+
 def verify_totp_secret(*, secret: str, code: str) -> bool:
     """Verify a TOTP code for a given secret.
 
@@ -45,8 +95,10 @@ def verify_totp_secret(*, secret: str, code: str) -> bool:
     if not code.isdigit():
         return False
 
-    totp: TOTP = totp_from_secret(secret)
-    ok: bool = totp.verify(code, valid_window=settings.otp_valid_window)
+    try:
+        ok: bool = otp_verify(secret, code)
+    except (ValueError, TypeError):
+        ok = False
     logger.info("TOTP verify", extra={"ok": ok})
     return bool(ok)
 
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID, uuid4
 
 from bson import ObjectId
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
 
 from app.core.config import settings
-from app.db.gridfs import GridFsService
-from app.domain.enums import UserRole
+from app.db.gridfs import AsyncReadable, GridFsService, UploadTooLargeError
+from app.domain.enums import ProjectState, UserRole
 from app.domain.models import Project, User
 from app.repositories.projects import ProjectRepository
 from app.repositories.translator_languages import TranslatorLanguageRepository
@@ -39,10 +40,10 @@ class ProjectService:
 
     This service orchestrates the project creation workflow:
     1) validate role & upload size
-    2) upload original file to GridFS
+    2) stream the original file into GridFS
     3) create project in MongoDB
     4) assign translator (or close the project)
-    5) send email notification
+    5) queue the email notification (sent after the response; skipped when mail is disabled)
 
     Args:
         project_repo: Project repository.
@@ -75,6 +76,7 @@ class ProjectService:
         self._user_repo: UserRepository = user_repo
         self._gridfs: GridFsService = gridfs
         self._mailer: EmailService = mailer
+        self._assignment: ProjectAssignmentService = ProjectAssignmentService(project_repo, translator_lang_repo)
 
     async def create_project(
         self,
@@ -83,16 +85,20 @@ class ProjectService:
         language_code: str,
         original_filename: str,
         content_type: str,
-        content: bytes,
+        source: AsyncReadable,
+        size: Optional[int],
+        background_tasks: BackgroundTasks,
     ) -> CreateProjectResult:
         """Create a new project and run the assignment workflow.
 
         Args:
             customer: Authenticated customer user.
-            language_code: Target language (ISO 639-1).
+            language_code: Target language, already normalized (see `LanguageCode`).
             original_filename: Uploaded filename.
             content_type: Uploaded file content type.
-            content: File bytes.
+            source: Upload to stream into GridFS (e.g. `UploadFile`).
+            size: Declared upload size in bytes, if known.
+            background_tasks: Tasks run after the response; used for email notifications.
 
         Returns:
             CreateProjectResult: Created project and assignment result.
@@ -104,25 +110,39 @@ class ProjectService:
             raise HTTPException(status_code=403, detail="Only customers can create projects")
 
         max_bytes: int = settings.max_upload_mb * 1024 * 1024
-        if len(content) > max_bytes:
+        if size is not None and size > max_bytes:
             raise HTTPException(status_code=413, detail=f"Max upload size is {settings.max_upload_mb} MB")
 
-        file_id: ObjectId = await self._gridfs.upload(
-            filename=original_filename or "upload.bin",
-            data=content,
-            metadata={"content_type": content_type or "application/octet-stream"},
+        # The translator choice does not depend on the file; run its query while the upload streams.
+        best_translator: asyncio.Task[Optional[UUID]] = asyncio.create_task(
+            self._assignment.find_best_translator_id(language_code)
         )
 
-        project: Project = Project(
-            id=uuid4(),
-            customer_id=customer.id,
-            translator_id=None,
-            language_code=language_code.lower(),
-            original_file_id=str(file_id),
-        )
-
-        await self._project_repo.ensure_indexes()
-        await self._project_repo.create(project)
+        filename: str = original_filename or "upload.bin"
+        try:
+            file_id: ObjectId = await self._gridfs.upload_stream(
+                filename=filename,
+                source=source,
+                metadata={"content_type": content_type or "application/octet-stream"},
+                max_bytes=max_bytes,
+            )
+
+            project: Project = Project(
+                id=uuid4(),
+                customer_id=customer.id,
+                translator_id=None,
+                language_code=language_code,
+                original_file_id=str(file_id),
+                original_file_name=filename,
+            )
+
+            await self._project_repo.create(project)
+        except UploadTooLargeError:
+            best_translator.cancel()
+            raise HTTPException(status_code=413, detail=f"Max upload size is {settings.max_upload_mb} MB")
+        except BaseException:
+            best_translator.cancel()
+            raise
 
         logger.info(
             "Project created",
@@ -134,13 +154,45 @@ class ProjectService:
             },
         )
 
-        assignment: ProjectAssignmentService = ProjectAssignmentService(self._project_repo, self._translator_lang_repo)
-        translator_id: UUID | None= await assignment.assign_or_close(project.id, project.language_code)
+        translator_id: UUID | None = await best_translator
+        await self._assignment.apply(project.id, translator_id, language_code=language_code)
+
+        # Mirror the write `apply` just made instead of re-reading the document.
+        if translator_id is not None:
+            project.translator_id = translator_id
+            project.state = ProjectState.ASSIGNED
+        else:
+            project.state = ProjectState.CLOSED
+
+        await self._queue_notification(project, translator_id, customer, background_tasks)
+
+        return CreateProjectResult(project=project, assigned_translator_id=translator_id)
+
+    async def _queue_notification(
+        self,
+        project: Project,
+        translator_id: Optional[UUID],
+        customer: User,
+        background_tasks: BackgroundTasks,
+    ) -> None:
+        """Queue the assignment (or closure) email for after the response.
+
+        Does nothing, including the recipient lookup, when the mailer is disabled.
+
+        Args:
+            project: Created project.
+            translator_id: Assigned translator id, or None if the project was closed.
+            customer: Customer who created the project.
+            background_tasks: Tasks run after the response.
+        """
+        if not self._mailer.enabled:
+            return
 
         if translator_id is not None:
             translator: User | None = await self._user_repo.get_by_id(translator_id)
             if translator is not None:
-                self._mailer.send(
+                background_tasks.add_task(
+                    self._mailer.send_async,
                     to=str(translator.email_address),
                     subject="New translation project assigned",
                     text=(
@@ -153,7 +205,8 @@ class ProjectService:
         else:
             refreshed_customer: User | None = await self._user_repo.get_by_id(customer.id)
             if refreshed_customer is not None:
-                self._mailer.send(
+                background_tasks.add_task(
+                    self._mailer.send_async,
                     to=str(refreshed_customer.email_address),
                     subject="Project closed - no translator available",
                     text=(
@@ -163,7 +216,3 @@ class ProjectService:
                         f"Project ID: {project.id}\n"
                     ),
                 )
-
-        stored: Project | None = await self._project_repo.get_by_id(project.id)
-        assert stored is not None
-        return CreateProjectResult(project=stored, assigned_translator_id=translator_id)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+"""Copy GridFS filenames onto projects created before `original_file_name` existed.
+
+Project listings read the denormalized `original_file_name` field instead of
+querying GridFS, so older projects show no filename until this has run once.
+Safe to run repeatedly; only projects missing the field are touched.
+
+Usage:
+    python Backend\scripts\backfill_original_file_names.py [--mongodb-uri URI]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from typing import Any, Mapping
+
+
+def _preconfigure_env() -> str:
+    """Parse CLI args (if any) and ensure MONGODB_URI env var is set before
+    importing application modules.
+
+    Returns:
+        str: Final MongoDB URI used.
+    """
+
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--mongodb-uri", dest="mongodb_uri", help="MongoDB URI to use (overrides env)")
+    args, _ = parser.parse_known_args()
+
+    if args.mongodb_uri:
+        os.environ.setdefault("MONGODB_URI", args.mongodb_uri)
+    if "MONGODB_URI" not in os.environ:
+        os.environ["MONGODB_URI"] = "mongodb://host.docker.internal:27017"
+
+    return os.environ["MONGODB_URI"]
+
+
+_preconfigure_env()
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from app.db.mongo import get_db
+
+logger = logging.getLogger(__name__)
+
+
+async def _backfill() -> None:
+    db = get_db()
+    projects = db["projects"]
+
+    missing: list[Mapping[str, Any]] = await projects.find(
+        {"original_file_name": {"$exists": False}}, projection={"_id": 0, "id": 1, "original_file_id": 1}
+    ).to_list(length=None)
+
+    file_ids: list[ObjectId] = [ObjectId(d["original_file_id"]) for d in missing if ObjectId.is_valid(d.get("original_file_id"))]
+    names: dict[str, str] = {
+        str(f["_id"]): f["filename"]
+        async for f in db["files.files"].find({"_id": {"$in": file_ids}}, projection={"filename": 1})
+    }
+
+    ops: list[UpdateOne] = [
+        UpdateOne({"id": d["id"]}, {"$set": {"original_file_name": names.get(d.get("original_file_id"))}})
+        for d in missing
+    ]
+    if ops:
+        await projects.bulk_write(ops, ordered=False)
+    logger.info("Backfilled original_file_name on %d projects", len(ops))
+
+
+def main() -> None:
+    """Run the backfill routine in the event loop."""
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_backfill())
+
+
+if __name__ == "__main__":
+    main()
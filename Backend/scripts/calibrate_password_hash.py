@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+"""Measure which Argon2id time cost hits the target hash time on this host.
+
+Run once per deployment target (not from the app) and pin the printed value as
+`PASSWORD_HASH_TIME_COST` so every worker hashes with identical parameters.
+
+Usage:
+    python Backend\scripts\calibrate_password_hash.py [--target-ms 300]
+"""
+
+import argparse
+import logging
+
+from argon2 import PasswordHasher
+
+from app.core.config import settings
+from app.security.passwords import calibrate
+
+
+def main() -> None:
+    """Run the calibration and print the setting to pin."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--target-ms", type=int, default=settings.password_hash_target_ms, help="Target hash time in milliseconds"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    hasher: PasswordHasher = calibrate(args.target_ms)
+    print(f"PASSWORD_HASH_TIME_COST={hasher.time_cost}")
+
+
+if __name__ == "__main__":
+    main()
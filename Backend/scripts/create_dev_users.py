@@ -47,7 +47,7 @@ from app.db.mongo import get_db
 from app.domain.enums import UserRole
 from app.domain.models import User
 from app.repositories.users import UserRepository
-from app.security.passwords import hash_password
+from app.security.passwords import hash_password_async
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +56,17 @@ async def _create_users() -> None:
     db = get_db()
     repo = UserRepository(db)
 
-    await repo.ensure_indexes()
+    # Argon2 releases the GIL, so the three hashes run in parallel on worker threads.
+    hashes: list[str]
+    hashes, _ = await asyncio.gather(
+        asyncio.gather(
+            hash_password_async("adminpass"),
+            hash_password_async("customerpass"),
+            hash_password_async("translatorpass"),
+        ),
+        repo.ensure_indexes(),
+    )
+    admin_hash, customer_hash, translator_hash = hashes
 
     users: list[User] = [
         User.model_validate(
@@ -65,7 +75,7 @@ async def _create_users() -> None:
                 "name": "admin",
                 "email_address": "admin@example.com",
                 "role": UserRole.ADMINISTRATOR,
-                "password_hash": hash_password("adminpass"),
+                "password_hash": admin_hash,
             }
         ),
         User.model_validate(
@@ -74,7 +84,7 @@ async def _create_users() -> None:
                 "name": "customer",
                 "email_address": "customer@example.com",
                 "role": UserRole.CUSTOMER,
-                "password_hash": hash_password("customerpass"),
+                "password_hash": customer_hash,
             }
         ),
         User.model_validate(
@@ -83,18 +93,18 @@ async def _create_users() -> None:
                 "name": "translator",
                 "email_address": "translator@example.com",
                 "role": UserRole.TRANSLATOR,
-                "password_hash": hash_password("translatorpass"),
+                "password_hash": translator_hash,
             }
         ),
     ]
 
-    for u in users:
-        await repo._col.update_one(
-            {"id": str(u.id)},
-            {"$set": u.model_dump(mode="json")},
-            upsert=True,
-        )
-        logger.info("Created/updated user %s (%s)", u.name, u.role.value)
+    created: int = await repo.upsert_many(users)
+    logger.info(
+        "Upserted %d dev users (%d new): %s",
+        len(users),
+        created,
+        ", ".join(f"{u.name} ({u.role.value})" for u in users),
+    )
 
 
 def main() -> None:
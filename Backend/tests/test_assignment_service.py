@@ -10,30 +10,13 @@ from app.services.assignment import ProjectAssignmentService
 class _ProjectRepoFake:
     """In-memory fake of ProjectRepository for assignment tests.
 
-    This fake provides:
-        - `count_active_by_translator_ids` to simulate translator load
-        - `assign_translator` and `close_project` to record side effects
-
-    Args:
-        counts: Optional mapping {translator_id: active_project_count}.
+    This fake provides `assign_translator` and `close_project` to record side effects.
     """
 
-    def __init__(self, *, counts: dict[str, int] | None = None) -> None:
-        self.counts = counts or {}
+    def __init__(self) -> None:
         self.assigned: list[tuple[str, str, str]] = []
         self.closed: list[str] = []
 
-    async def count_active_by_translator_ids(self, translator_ids: list[UUID]) -> dict[str, int]:
-        """Return active project counts for the given translators.
-
-        Args:
-            translator_ids: Translator UUIDs.
-
-        Returns:
-            dict[str, int]: Mapping {translator_id: active_project_count}.
-        """
-        return {str(t): int(self.counts.get(str(t), 0)) for t in translator_ids}
-
     async def assign_translator(self, project_id: UUID, translator_id: UUID, state: str) -> None:
         """Record assignment side effect."""
         self.assigned.append((str(project_id), str(translator_id), state))
@@ -44,14 +27,22 @@ class _ProjectRepoFake:
 
 
 class _TranslatorLangRepoFake:
-    """Fake TranslatorLanguageRepository returning a predefined translator list."""
+    """Fake TranslatorLanguageRepository choosing from a predefined translator list.
 
-    def __init__(self, ids: list[str]):
+    Args:
+        ids: Translator ids supporting the language, in repository order.
+        counts: Optional mapping {translator_id: active_project_count}.
+    """
+
+    def __init__(self, ids: list[str], *, counts: dict[str, int] | None = None):
         self._ids = ids
+        self._counts = counts or {}
 
-    async def list_translator_ids_for_language(self, language_code: str) -> list[str]:
-        """Return translator ids that support the requested language."""
-        return self._ids
+    async def find_least_loaded_translator(self, language_code: str) -> UUID | None:
+        """Return the first translator with the minimum active count (like the aggregation)."""
+        if not self._ids:
+            return None
+        return UUID(min(self._ids, key=lambda t: self._counts.get(t, 0)))
 
 
 @pytest.mark.asyncio
@@ -75,10 +66,12 @@ async def test_assign_or_close_picks_least_loaded_translator() -> None:
     t2 = uuid4()
     t3 = uuid4()
 
-    project_repo = _ProjectRepoFake(counts={str(t1): 5, str(t2): 1, str(t3): 1})
+    project_repo = _ProjectRepoFake()
     svc = ProjectAssignmentService(
         project_repo,  # type: ignore[arg-type]
-        _TranslatorLangRepoFake([str(t1), str(t2), str(t3)]),  # type: ignore[arg-type]
+        _TranslatorLangRepoFake(
+            [str(t1), str(t2), str(t3)], counts={str(t1): 5, str(t2): 1, str(t3): 1}
+        ),  # type: ignore[arg-type]
     )
 
     chosen = await svc.assign_or_close(project_id, "cs")
@@ -44,7 +44,7 @@ class _UserRepoFake:
 
 
 @pytest.mark.asyncio
-async def test_login_invalid_user(monkeypatch) -> None:
+async def test_login_invalid_user() -> None:
     """Login should fail with 401 when the user does not exist.
 
     Scenario:
@@ -55,17 +55,15 @@ async def test_login_invalid_user(monkeypatch) -> None:
     """
     from app import api
 
-    monkeypatch.setattr(api.auth, "UserRepository", lambda db: _UserRepoFake(None))
-
     payload = api.auth.LoginIn.model_validate({"username": "alice", "password": "x"})
 
     with pytest.raises(Exception) as exc:
-        await login(payload=payload, db=None)
+        await login(payload=payload, repo=_UserRepoFake(None))
     assert "Invalid credentials" in str(exc.value)
 
 
 @pytest.mark.asyncio
-async def test_login_invalid_password(monkeypatch) -> None:
+async def test_login_invalid_password() -> None:
     """Login should fail with 401 when the password is incorrect.
 
     Scenario:
@@ -79,17 +77,15 @@ async def test_login_invalid_password(monkeypatch) -> None:
     from app import api
 
     u = _User(user_id=str(uuid4()), name="alice", role="CUSTOMER", password_hash=hash_password("correct"))
-    monkeypatch.setattr(api.auth, "UserRepository", lambda db: _UserRepoFake(u))
-
     payload = api.auth.LoginIn.model_validate({"username": "alice", "password": "wrong"})
 
     with pytest.raises(Exception) as exc:
-        await login(payload=payload, db=None)
+        await login(payload=payload, repo=_UserRepoFake(u))
     assert "Invalid credentials" in str(exc.value)
 
 
 @pytest.mark.asyncio
-async def test_login_success(monkeypatch) -> None:
+async def test_login_success() -> None:
     """Login should return a JWT token for valid credentials.
 
     Scenario:
@@ -103,12 +99,34 @@ async def test_login_success(monkeypatch) -> None:
     from app import api
 
     u = _User(user_id=str(uuid4()), name="alice", role="CUSTOMER", password_hash=hash_password("secret"))
-    monkeypatch.setattr(api.auth, "UserRepository", lambda db: _UserRepoFake(u))
-
     payload = api.auth.LoginIn.model_validate({"username": "alice", "password": "secret"})
 
-    res = await login(payload=payload, db=None)
+    res = await login(payload=payload, repo=_UserRepoFake(u))
     assert res.access_token
     assert res.token_type == "bearer"
     assert str(res.user_id) == str(u.id)
     assert res.role == "CUSTOMER"
+
+
+@pytest.mark.asyncio
+async def test_login_missing_password_fails_fast() -> None:
+    """Login without a password should fail before touching the repository.
+
+    Scenario:
+        Payload omits the password field.
+
+    Expected behavior:
+        Endpoint raises an exception containing "Missing credentials" and the
+        repository is never queried.
+    """
+    from app import api
+
+    class _NoRepo:
+        async def get_by_name(self, name: str):
+            raise AssertionError("repository must not be used")
+
+    payload = api.auth.LoginIn.model_validate({"username": "alice"})
+
+    with pytest.raises(Exception) as exc:
+        await login(payload=payload, repo=_NoRepo())
+    assert "Missing credentials" in str(exc.value)
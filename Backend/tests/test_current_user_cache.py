@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.domain.enums import UserRole
+from app.domain.models import User
+from app.security.jwt import create_access_token
+
+
+class _UserRepoFake:
+    """Fake UserRepository counting `get_by_id` calls."""
+
+    def __init__(self, user: User) -> None:
+        self._user = user
+        self.calls = 0
+
+    async def get_by_id(self, user_id):
+        self.calls += 1
+        return self._user if user_id == self._user.id else None
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_cached_per_token() -> None:
+    """Repeated requests with the same token should hit the database only once.
+
+    Scenario:
+        - The same bearer token is resolved twice.
+        - The user is then invalidated and resolved again.
+
+    Expected behavior:
+        - Second resolution is served from the token cache.
+        - After `invalidate_user`, the user is loaded from the repository again.
+    """
+    from app.api import deps
+
+    user = User.model_validate(
+        {"id": uuid4(), "name": "alice", "email_address": "a@x.com", "role": UserRole.CUSTOMER, "password_hash": "x"}
+    )
+    fake = _UserRepoFake(user)
+    deps._token_cache.clear()
+
+    token = create_access_token(user_id=user.id, role=user.role)
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    assert (await deps.current_user_dep(creds=creds, repo=fake)).id == user.id
+    assert (await deps.current_user_dep(creds=creds, repo=fake)).id == user.id
+    assert fake.calls == 1
+
+    deps.invalidate_user(user.id)
+    await deps.current_user_dep(creds=creds, repo=fake)
+    assert fake.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_current_user_rejects_invalid_token() -> None:
+    """Invalid tokens must never be cached or accepted.
+
+    Expected behavior:
+        - Dependency raises an exception containing "Invalid token".
+    """
+    from app.api import deps
+
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials="not-a-jwt")
+    with pytest.raises(Exception) as exc:
+        await deps.current_user_dep(creds=creds, repo=None)
+    assert "Invalid token" in str(exc.value)
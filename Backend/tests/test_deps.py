@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from fastapi.routing import APIRoute
+
+from app.api import auth, feedback, health, projects, users
+
+
+def _calls(dependant) -> list:
+    """Collect all dependency callables in a dependant tree.
+
+    Args:
+        dependant: FastAPI dependant.
+
+    Returns:
+        list: Dependency callables (depth-first).
+    """
+    out: list = []
+    for sub in dependant.dependencies:
+        out.append(sub.call)
+        out.extend(_calls(sub))
+    return out
+
+
+def test_routes_share_a_single_db_dependency() -> None:
+    """All routes should resolve the database through the same `db_dep` callable.
+
+    FastAPI caches dependencies per request by callable identity. A second copy of
+    `db_dep` would be resolved separately.
+
+    Expected behavior:
+        - Every dependency named `db_dep` is `app.api.deps.db_dep`.
+        - At least one route depends on it.
+    """
+    from app.api import deps
+
+    found = [
+        call
+        for module in (auth, feedback, health, projects, users)
+        for route in module.router.routes
+        if isinstance(route, APIRoute)
+        for call in _calls(route.dependant)
+        if getattr(call, "__name__", "") == "db_dep"
+    ]
+    assert found
+    assert all(call is deps.db_dep for call in found)
+
+
+def test_clear_shared_drops_cached_instances() -> None:
+    """Shutdown should forget app-wide instances bound to the closed client.
+
+    Scenario:
+        - A request resolves a shared repository (cached on `app.state`).
+        - `clear_shared` runs, as in the lifespan shutdown.
+        - The next request resolves the repository again.
+
+    Expected behavior:
+        - The cached attribute is gone after `clear_shared`.
+        - The next resolution builds a new instance instead of reusing the old one.
+    """
+    from types import SimpleNamespace
+
+    from fastapi import FastAPI
+
+    from app.api import deps
+
+    app = FastAPI()
+    request = SimpleNamespace(app=app)
+
+    first = deps._shared(request, "user_repo", object)  # type: ignore[arg-type]
+    assert app.state.user_repo is first
+
+    deps.clear_shared(app)
+    assert not hasattr(app.state, "user_repo")
+
+    second = deps._shared(request, "user_repo", object)  # type: ignore[arg-type]
+    assert second is not first
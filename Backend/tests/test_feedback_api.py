@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.mark.asyncio
+async def test_feedback_conditional_get_returns_304() -> None:
+    """Feedback endpoint should honour `If-None-Match`.
+
+    Scenario:
+        - Current user is the project's CUSTOMER and feedback exists.
+        - Client repeats the GET with the ETag from the first response.
+
+    Expected behavior:
+        - First GET returns 200 with ETag and private Cache-Control.
+        - Second GET returns 304 with an empty body.
+    """
+
+    from app.api import deps
+    from app.domain.enums import UserRole
+    from app.domain.models import Feedback, Project
+
+    customer_id = uuid4()
+    project = Project(id=uuid4(), customer_id=customer_id, language_code="cs", original_file_id="f")
+    feedback = Feedback(project_id=project.id, text="great")
+
+    class _User:
+        def __init__(self):
+            self.id = customer_id
+            self.role = UserRole.CUSTOMER
+
+    class _ProjectRepoFake:
+        async def get_with_feedback(self, project_id):
+            return (project, feedback) if project_id == project.id else None
+
+    async def _fake_current_user():
+        return _User()
+
+    async def _fake_project_repo():
+        return _ProjectRepoFake()
+
+    app.dependency_overrides[deps.current_user_dep] = _fake_current_user
+    app.dependency_overrides[deps.project_repo_dep] = _fake_project_repo
+
+    client = TestClient(app)
+
+    res = client.get(f"/feedback/projects/{project.id}")
+    assert res.status_code == 200
+    assert res.json()["text"] == "great"
+    assert res.headers["cache-control"] == "private, max-age=30"
+    etag = res.headers["etag"]
+
+    res = client.get(f"/feedback/projects/{project.id}", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+
+    app.dependency_overrides = {}
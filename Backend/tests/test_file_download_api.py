@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+class _GridOutFake:
+    """Minimal GridFS download stream serving fixed-size chunks from `data`."""
+
+    def __init__(self, data: bytes, chunk_size: int = 4) -> None:
+        self._data = data
+        self._chunk_size = chunk_size
+        self._pos = 0
+        self.filename = "doc.txt"
+        self.length = len(data)
+        self.metadata = {"content_type": "text/plain"}
+
+    def seek(self, pos: int) -> None:
+        self._pos = pos
+
+    async def readchunk(self) -> bytes:
+        # Like GridOut, return the rest of the current chunk.
+        end = (self._pos // self._chunk_size + 1) * self._chunk_size
+        chunk = self._data[self._pos:end]
+        self._pos += len(chunk)
+        return chunk
+
+
+@pytest.mark.asyncio
+async def test_download_honours_range_requests() -> None:
+    """File downloads should support single byte ranges.
+
+    Scenario:
+        - CUSTOMER downloads the original file of their project.
+        - Client requests the full file, a middle range, a suffix range and an out-of-bounds range.
+        - Client resumes with `If-Range` carrying the current ETag, a weak copy of it, and a stale one.
+
+    Expected behavior:
+        - Full response advertises `Accept-Ranges: bytes` with the full Content-Length and
+          is not gzip-encoded even when the client accepts gzip.
+        - Ranges return 206 with the exact bytes and a matching Content-Range.
+        - An unsatisfiable range returns 416.
+        - The ETag is strong; `If-Range` honours the range only for an exact strong match,
+          otherwise the full file is returned with 200.
+    """
+    from app.api import deps
+    from app.domain.enums import UserRole
+    from app.domain.models import Project
+
+    data = b"0123456789abcdef"
+    customer_id = uuid4()
+    project = Project(id=uuid4(), customer_id=customer_id, language_code="cs", original_file_id=str(ObjectId()))
+
+    class _User:
+        def __init__(self):
+            self.id = customer_id
+            self.role = UserRole.CUSTOMER
+
+    class _ProjectRepoFake:
+        async def get_by_id(self, project_id):
+            return project if project_id == project.id else None
+
+    class _GridFsFake:
+        async def open_download_stream(self, file_id):
+            return _GridOutFake(data)
+
+    async def _fake_current_user():
+        return _User()
+
+    async def _fake_project_repo():
+        return _ProjectRepoFake()
+
+    async def _fake_gridfs():
+        return _GridFsFake()
+
+    app.dependency_overrides[deps.current_user_dep] = _fake_current_user
+    app.dependency_overrides[deps.project_repo_dep] = _fake_project_repo
+    app.dependency_overrides[deps.gridfs_dep] = _fake_gridfs
+
+    client = TestClient(app)
+    url = f"/projects/{project.id}/original"
+
+    res = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert res.status_code == 200
+    assert res.content == data
+    assert "content-encoding" not in res.headers
+    assert res.headers["accept-ranges"] == "bytes"
+    assert res.headers["content-length"] == str(len(data))
+
+    res = client.get(url, headers={"Range": "bytes=3-9"})
+    assert res.status_code == 206
+    assert res.content == data[3:10]
+    assert res.headers["content-range"] == f"bytes 3-9/{len(data)}"
+
+    res = client.get(url, headers={"Range": "bytes=-5"})
+    assert res.status_code == 206
+    assert res.content == data[-5:]
+
+    res = client.get(url, headers={"Range": "bytes=100-"})
+    assert res.status_code == 416
+    assert res.headers["content-range"] == f"bytes */{len(data)}"
+
+    etag = client.get(url).headers["etag"]
+    assert not etag.startswith("W/")
+
+    res = client.get(url, headers={"Range": "bytes=3-9", "If-Range": etag})
+    assert res.status_code == 206
+    assert res.content == data[3:10]
+
+    for validator in (f"W/{etag}", '"stale"'):
+        res = client.get(url, headers={"Range": "bytes=3-9", "If-Range": validator})
+        assert res.status_code == 200
+        assert res.content == data
+
+    app.dependency_overrides = {}
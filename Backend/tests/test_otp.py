@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import time
+
+import pyotp
+
+from app.services.otp import otp_verify, verify_totp_secret
+
+_SECRET = "JBSWY3DPEHPK3PXP"
+
+
+def test_otp_verify_matches_pyotp() -> None:
+    """The HMAC-based verifier should accept codes produced by pyotp.
+
+    Expected behavior:
+        - Current pyotp code is accepted.
+        - Code from the previous time step is accepted (valid window = 1).
+        - Code from far outside the window is rejected.
+    """
+    totp = pyotp.TOTP(_SECRET, interval=30)
+    now = time.time()
+
+    assert otp_verify(_SECRET, totp.at(now))
+    assert otp_verify(_SECRET, totp.at(now - 30))
+
+    stale = totp.at(now - 3600)
+    if stale not in {totp.at(now + d) for d in (-30, 0, 30)}:
+        assert not otp_verify(_SECRET, stale)
+
+
+def test_verify_totp_secret_rejects_invalid_input() -> None:
+    """Malformed codes and secrets should be rejected without raising.
+
+    Expected behavior:
+        - Non-numeric code returns False.
+        - Invalid base32 secret returns False.
+    """
+    assert not verify_totp_secret(secret=_SECRET, code="abc123")
+    assert not verify_totp_secret(secret="!!!", code="123456")
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from argon2 import PasswordHasher, profiles
+
+from app.security.passwords import _hasher, hash_password, needs_rehash
+
+
+def _hash_with(time_cost: int, memory_cost: int) -> str:
+    base = profiles.RFC_9106_LOW_MEMORY
+    hasher = PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=base.parallelism,
+        hash_len=base.hash_len,
+        salt_len=base.salt_len,
+        type=base.type,
+    )
+    return hasher.hash("secret")
+
+
+def test_needs_rehash_only_upgrades_weaker_hashes() -> None:
+    """Stored hashes should only be rewritten when they are weaker than the configured cost.
+
+    Scenario:
+        - A hash made with the configured parameters.
+        - Hashes with fewer passes / less memory than configured.
+        - A hash with more passes than configured (e.g. from a stronger past setting).
+
+    Expected behavior:
+        - Only the weaker hashes need a rehash; equal and stronger ones are kept.
+    """
+    assert needs_rehash(hash_password("secret")) is False
+    assert needs_rehash(_hash_with(_hasher.time_cost - 1, _hasher.memory_cost)) is True
+    assert needs_rehash(_hash_with(_hasher.time_cost, _hasher.memory_cost // 2)) is True
+    assert needs_rehash(_hash_with(_hasher.time_cost + 3, _hasher.memory_cost)) is False
+    assert needs_rehash("not-an-argon2-hash") is False
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.mark.asyncio
+async def test_project_list_rows_match_validated_output() -> None:
+    """List rows built without validation must serialize exactly like validated ones.
+
+    Scenario:
+        - CUSTOMER lists projects; the repository returns a row with a translator name.
+        - ADMINISTRATOR lists feedback; the repository returns a raw row with string ids.
+
+    Expected behavior:
+        - Both responses equal the JSON produced by validating the same values.
+    """
+    from app.api import deps
+    from app.api.projects import AdminFeedbackProjectOut, ProjectListItemOut
+    from app.domain.enums import UserRole
+    from app.domain.models import Project
+
+    customer_id = uuid4()
+    translator_id = uuid4()
+    project = Project(
+        id=uuid4(),
+        customer_id=customer_id,
+        translator_id=translator_id,
+        language_code="cs",
+        original_file_id="f",
+        original_file_name="doc.txt",
+    )
+    admin_row = {
+        "id": str(project.id),
+        "language_code": "cs",
+        "state": "COMPLETED",
+        "customer_id": str(customer_id),
+        "translator_id": str(translator_id),
+        "customer_name": "alice",
+        "customer_email": "a@x.com",
+        "feedback_text": "great",
+        # Stored as in Mongo: JSON-mode dump, so UTC is spelled "Z".
+        "created_at": project.model_dump(mode="json")["created_at"],
+    }
+
+    class _User:
+        def __init__(self, role):
+            self.id = customer_id
+            self.role = role
+
+    class _ProjectRepoFake:
+        async def list_by_customer_with_translator_names(self, cid):
+            return [(project, "bob")] if cid == customer_id else []
+
+        async def list_with_feedback_joined(self, state=None):
+            return [admin_row]
+
+    async def _fake_project_repo():
+        return _ProjectRepoFake()
+
+    app.dependency_overrides[deps.project_repo_dep] = _fake_project_repo
+    client = TestClient(app)
+
+    app.dependency_overrides[deps.current_user_dep] = lambda: _User(UserRole.CUSTOMER)
+    res = client.get("/projects")
+    assert res.status_code == 200
+    expected = ProjectListItemOut(
+        id=project.id,
+        language_code="cs",
+        original_file_name="doc.txt",
+        state=project.state_str,
+        created_at=project.created_at_iso,
+        customer_id=customer_id,
+        translator_id=translator_id,
+        translator_name="bob",
+    )
+    assert res.json() == [expected.model_dump(mode="json")]
+
+    app.dependency_overrides[deps.current_user_dep] = lambda: _User(UserRole.ADMINISTRATOR)
+    res = client.get("/projects/admin/feedback")
+    assert res.status_code == 200
+    assert res.json() == [
+        AdminFeedbackProjectOut.model_validate({**admin_row, "created_at": project.created_at_iso}).model_dump(
+            mode="json"
+        )
+    ]
+
+    app.dependency_overrides = {}
@@ -3,6 +3,7 @@ from __future__ import annotations
 from uuid import UUID
 
 import pytest
+from fastapi import BackgroundTasks
 
 from app.domain.enums import ProjectState, UserRole
 from app.domain.models import User
@@ -26,32 +27,15 @@ class _ProjectRepoFake:
         self.closed: list[str] = []
         self._stored: dict[str, object] = {}
 
-    async def ensure_indexes(self) -> None:
-        return None
-
     async def create(self, project):
         self.created.append(project)
-        self._stored[str(project.id)] = project
+        # Store a copy so the service cannot observe repository-side mutations.
+        self._stored[str(project.id)] = project.model_copy()
         return project
 
     async def get_by_id(self, project_id: UUID):
         return self._stored.get(str(project_id))
 
-    async def count_active_by_translator_ids(self, translator_ids: list[UUID]) -> dict[str, int]:
-        """Return active project counts per translator.
-
-        Args:
-            translator_ids: Translator UUIDs.
-
-        Returns:
-            dict[str, int]: Mapping {translator_id: active_project_count}.
-
-        Notes:
-            The default behavior is "everyone has 0 active projects" which
-            makes assignment deterministic for unit tests.
-        """
-        return {str(t): 0 for t in translator_ids}
-
     async def close_project(self, project_id: UUID) -> None:
         p = self._stored.get(str(project_id))
         if p:
@@ -67,13 +51,18 @@ class _ProjectRepoFake:
 
 
 class _TranslatorLangRepoFake:
-    """Fake of TranslatorLanguageRepository returning a predefined translator list."""
+    """Fake of TranslatorLanguageRepository choosing from a predefined translator list.
+
+    Notes:
+        Everyone is treated as having 0 active projects, so the first id wins,
+        which makes assignment deterministic for unit tests.
+    """
 
     def __init__(self, ids: list[str]):
         self._ids = ids
 
-    async def list_translator_ids_for_language(self, language_code: str) -> list[str]:
-        return self._ids
+    async def find_least_loaded_translator(self, language_code: str) -> UUID | None:
+        return UUID(self._ids[0]) if self._ids else None
 
 
 class _UserRepoFake:
@@ -93,18 +82,30 @@ class _GridFsFake:
         self.file_id = file_id
         self.uploaded: list[tuple[str, bytes, dict]] = []
 
-    async def upload(self, *, filename: str, data: bytes, metadata: dict | None = None):
-        self.uploaded.append((filename, data, metadata or {}))
+    async def upload_stream(self, *, filename: str, source, metadata: dict | None = None, max_bytes: int | None = None):
+        self.uploaded.append((filename, await source.read(), metadata or {}))
         return self.file_id
 
 
+class _SourceFake:
+    """Async-readable upload source returning `data` on the first read."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    async def read(self, size: int = -1) -> bytes:
+        data, self._data = self._data, b""
+        return data
+
+
 class _EmailFake:
     """Fake email service collecting sent messages for assertions."""
 
-    def __init__(self) -> None:
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
         self.sent: list[dict] = []
 
-    def send(self, *, to: str, subject: str, text: str) -> None:
+    async def send_async(self, *, to: str, subject: str, text: str) -> None:
         self.sent.append({"to": to, "subject": subject, "text": text})
 
 
@@ -122,7 +123,7 @@ async def test_project_service_creates_and_assigns_when_translator_exists() -> N
         - Project is persisted.
         - Translator is assigned.
         - Project ends in ASSIGNED state.
-        - Translator receives an email notification.
+        - Translator email notification is queued, not sent inline.
     """
 
     customer = User.model_validate({"id": UUID("00000000-0000-0000-0000-000000000001"), "name": "cust", "email_address": "c@x.com", "role": UserRole.CUSTOMER, "password_hash": "x"})
@@ -133,6 +134,7 @@ async def test_project_service_creates_and_assigns_when_translator_exists() -> N
     user_repo = _UserRepoFake({str(customer.id): customer, str(translator.id): translator})
     fs = _GridFsFake()
     mailer = _EmailFake()
+    tasks = BackgroundTasks()
 
     svc = ProjectService(
         project_repo=project_repo,  # type: ignore[arg-type]
@@ -147,8 +149,12 @@ async def test_project_service_creates_and_assigns_when_translator_exists() -> N
         language_code="cs",
         original_filename="a.txt",
         content_type="text/plain",
-        content=b"hello",
+        source=_SourceFake(b"hello"),
+        size=5,
+        background_tasks=tasks,
     )
+    assert not mailer.sent
+    await tasks()
 
     assert res.project.customer_id == customer.id
     assert res.assigned_translator_id == translator.id
@@ -169,7 +175,7 @@ async def test_project_service_closes_when_no_translator() -> None:
     Expected behavior:
         - Project is persisted.
         - Project is transitioned to CLOSED state.
-        - CUSTOMER receives an email notification.
+        - CUSTOMER email notification is queued, not sent inline.
     """
 
     customer = User.model_validate({"id": UUID("00000000-0000-0000-0000-000000000001"), "name": "cust", "email_address": "c@x.com", "role": UserRole.CUSTOMER, "password_hash": "x"})
@@ -179,6 +185,7 @@ async def test_project_service_closes_when_no_translator() -> None:
     user_repo = _UserRepoFake({str(customer.id): customer})
     fs = _GridFsFake()
     mailer = _EmailFake()
+    tasks = BackgroundTasks()
 
     svc = ProjectService(
         project_repo=project_repo,  # type: ignore[arg-type]
@@ -193,9 +200,57 @@ async def test_project_service_closes_when_no_translator() -> None:
         language_code="cs",
         original_filename="a.txt",
         content_type="text/plain",
-        content=b"hello",
+        source=_SourceFake(b"hello"),
+        size=5,
+        background_tasks=tasks,
     )
+    assert not mailer.sent
+    await tasks()
 
     assert res.assigned_translator_id is None
     assert res.project.state == ProjectState.CLOSED
     assert mailer.sent and mailer.sent[0]["to"] == "c@x.com"
+
+
+@pytest.mark.asyncio
+async def test_project_service_rejects_oversized_upload_before_io() -> None:
+    """ProjectService should reject a too-large declared upload up front.
+
+    Scenario:
+        - A CUSTOMER creates a project whose declared size exceeds `max_upload_mb`.
+
+    Expected behavior:
+        - HTTP 413 is raised.
+        - Nothing is uploaded to GridFS and no project is persisted.
+    """
+    from fastapi import HTTPException
+
+    from app.core.config import settings
+
+    customer = User.model_validate({"id": UUID("00000000-0000-0000-0000-000000000001"), "name": "cust", "email_address": "c@x.com", "role": UserRole.CUSTOMER, "password_hash": "x"})
+
+    project_repo = _ProjectRepoFake()
+    fs = _GridFsFake()
+
+    svc = ProjectService(
+        project_repo=project_repo,  # type: ignore[arg-type]
+        translator_lang_repo=_TranslatorLangRepoFake([]),  # type: ignore[arg-type]
+        user_repo=_UserRepoFake({}),  # type: ignore[arg-type]
+        gridfs=fs,  # type: ignore[arg-type]
+        mailer=_EmailFake(),  # type: ignore[arg-type]
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        await svc.create_project(
+            customer=customer,
+            language_code="cs",
+            original_filename="a.txt",
+            content_type="text/plain",
+            source=_SourceFake(b""),
+            size=settings.max_upload_mb * 1024 * 1024 + 1,
+            background_tasks=BackgroundTasks(),
+        )
+
+    assert exc.value.status_code == 413
+    assert not fs.uploaded
+    assert not project_repo.created
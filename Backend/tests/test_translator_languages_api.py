@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_translator_languages() -> None:
+    """Bulk endpoint should add all languages with a single repository call.
+
+    Scenario:
+        - TRANSLATOR adds "DE", "de" and "fr" for themselves; "fr" already exists.
+        - An empty list is submitted.
+        - A list containing a code that is not ISO 639-1 ("xx") is submitted.
+
+    Expected behavior:
+        - Codes are lowercased and deduplicated before one `add_languages` call.
+        - Response reports 1 inserted and 1 existing.
+        - Empty payload and unsupported codes are rejected with 422 without touching the repository.
+    """
+    from app.api import deps
+    from app.domain.enums import UserRole
+
+    translator_id = uuid4()
+    calls: list[set[str]] = []
+
+    class _User:
+        def __init__(self):
+            self.id = translator_id
+            self.role = UserRole.TRANSLATOR
+
+    class _UserRepoFake:
+        async def get_role(self, user_id):
+            return UserRole.TRANSLATOR if user_id == translator_id else None
+
+    class _TranslatorLangRepoFake:
+        async def add_languages(self, tid, codes):
+            calls.append(set(codes))
+            return len(set(codes) - {"fr"})
+
+    async def _fake_current_user():
+        return _User()
+
+    async def _fake_user_repo():
+        return _UserRepoFake()
+
+    async def _fake_tl_repo():
+        return _TranslatorLangRepoFake()
+
+    app.dependency_overrides[deps.current_user_dep] = _fake_current_user
+    app.dependency_overrides[deps.user_repo_dep] = _fake_user_repo
+    app.dependency_overrides[deps.translator_lang_repo_dep] = _fake_tl_repo
+
+    client = TestClient(app)
+    url = f"/users/translators/{translator_id}/languages:bulk"
+
+    res = client.post(url, json=[{"language_code": "DE"}, {"language_code": "de"}, {"language_code": "fr"}])
+    assert res.status_code == 201
+    assert res.json() == {"inserted": 1, "existing": 1}
+    assert calls == [{"de", "fr"}]
+
+    res = client.post(url, json=[])
+    assert res.status_code == 422
+
+    res = client.post(url, json=[{"language_code": "de"}, {"language_code": "xx"}])
+    assert res.status_code == 422
+    assert len(calls) == 1
+
+    app.dependency_overrides = {}
+
+
+@pytest.mark.asyncio
+async def test_delete_legacy_translator_language() -> None:
+    """Delete endpoint should accept stored codes outside the ISO 639-1 set.
+
+    Scenario:
+        - TRANSLATOR deletes "XX", a legacy code stored before codes were validated.
+        - TRANSLATOR deletes a code that is not two letters long.
+
+    Expected behavior:
+        - The lower-cased code is passed to `delete_language` and 204 is returned.
+        - A malformed code is rejected with 422 without touching the repository.
+    """
+    from app.api import deps
+    from app.domain.enums import UserRole
+
+    translator_id = uuid4()
+    deleted: list[str] = []
+
+    class _User:
+        def __init__(self):
+            self.id = translator_id
+            self.role = UserRole.TRANSLATOR
+
+    class _UserRepoFake:
+        async def get_role(self, user_id):
+            return UserRole.TRANSLATOR if user_id == translator_id else None
+
+    class _TranslatorLangRepoFake:
+        async def delete_language(self, *, translator_id, language_code):
+            deleted.append(language_code)
+            return True
+
+    async def _fake_current_user():
+        return _User()
+
+    async def _fake_user_repo():
+        return _UserRepoFake()
+
+    async def _fake_tl_repo():
+        return _TranslatorLangRepoFake()
+
+    app.dependency_overrides[deps.current_user_dep] = _fake_current_user
+    app.dependency_overrides[deps.user_repo_dep] = _fake_user_repo
+    app.dependency_overrides[deps.translator_lang_repo_dep] = _fake_tl_repo
+
+    client = TestClient(app)
+    url = f"/users/translators/{translator_id}/languages"
+
+    res = client.delete(f"{url}/XX")
+    assert res.status_code == 204
+    assert deleted == ["xx"]
+
+    res = client.delete(f"{url}/xyz")
+    assert res.status_code == 422
+    assert deleted == ["xx"]
+
+    app.dependency_overrides = {}
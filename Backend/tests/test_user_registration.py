@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import pytest
+from pymongo.errors import DuplicateKeyError
 
 from app.api.users import RegisterUserIn, register_customer, register_translator
 
@@ -17,12 +18,12 @@ class _RepoFake:
 
     async def create(self, user):
         if self.fail_on_create:
-            raise Exception("duplicate")
+            raise DuplicateKeyError("E11000 duplicate key")
         self.created.append(user)
 
 
 @pytest.mark.asyncio
-async def test_register_customer_success(monkeypatch) -> None:
+async def test_register_customer_success() -> None:
     """Registration should create a CUSTOMER account with a hashed password.
 
     Scenario:
@@ -34,10 +35,7 @@ async def test_register_customer_success(monkeypatch) -> None:
         - Password is stored as a hash.
         - Repository create is called.
     """
-    from app import api
-
     fake = _RepoFake()
-    monkeypatch.setattr(api.users, "UserRepository", lambda db: fake)
 
     payload = RegisterUserIn.model_validate(
         {
@@ -47,7 +45,7 @@ async def test_register_customer_success(monkeypatch) -> None:
         }
     )
 
-    res = await register_customer(payload=payload, db=None)
+    res = await register_customer(payload=payload, repo=fake)
     assert res.role.value == "CUSTOMER"
     assert res.name == "alice123"
     assert res.email_address == "alice@example.com"
@@ -57,7 +55,7 @@ async def test_register_customer_success(monkeypatch) -> None:
 
 
 @pytest.mark.asyncio
-async def test_register_translator_success(monkeypatch) -> None:
+async def test_register_translator_success() -> None:
     """Registration should create a TRANSLATOR account.
 
     Scenario:
@@ -68,10 +66,7 @@ async def test_register_translator_success(monkeypatch) -> None:
         - Endpoint returns a user with TRANSLATOR role.
         - Repository create is called.
     """
-    from app import api
-
     fake = _RepoFake()
-    monkeypatch.setattr(api.users, "UserRepository", lambda db: fake)
 
     payload = RegisterUserIn.model_validate(
         {
@@ -81,26 +76,23 @@ async def test_register_translator_success(monkeypatch) -> None:
         }
     )
 
-    res = await register_translator(payload=payload, db=None)
+    res = await register_translator(payload=payload, repo=fake)
     assert res.role.value == "TRANSLATOR"
     assert fake.created
     assert fake.created[0].role.value == "TRANSLATOR"
 
 
 @pytest.mark.asyncio
-async def test_register_duplicate_returns_409(monkeypatch) -> None:
+async def test_register_duplicate_returns_409() -> None:
     """Registration should fail with a conflict when user already exists.
 
     Scenario:
-        - Repository create fails (e.g., duplicate key).
+        - Repository create fails with a duplicate key.
 
     Expected behavior:
         - Endpoint raises an exception containing "already exists".
     """
-    from app import api
-
     fake = _RepoFake(fail_on_create=True)
-    monkeypatch.setattr(api.users, "UserRepository", lambda db: fake)
 
     payload = RegisterUserIn.model_validate(
         {
@@ -111,6 +103,75 @@ async def test_register_duplicate_returns_409(monkeypatch) -> None:
     )
 
     with pytest.raises(Exception) as exc:
-        await register_customer(payload=payload, db=None)
+        await register_customer(payload=payload, repo=fake)
 
     assert "already exists" in str(exc.value)
+
+
+@pytest.mark.asyncio
+async def test_register_conflict_is_cached() -> None:
+    """A duplicate-key failure should short-circuit retries of the same name and email.
+
+    Scenario:
+        - Repository create raises DuplicateKeyError.
+        - The same payload is submitted again.
+
+    Expected behavior:
+        - Both attempts fail with 409.
+        - Repository create is called only once.
+    """
+    from fastapi import HTTPException
+
+    from app.api import users
+
+    class _DuplicateRepo(_RepoFake):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls = 0
+
+        async def create(self, user):
+            self.calls += 1
+            raise DuplicateKeyError("E11000 duplicate key")
+
+    users._register_conflicts.clear()
+    fake = _DuplicateRepo()
+    payload = RegisterUserIn.model_validate(
+        {"name": "carol123", "email_address": "carol@example.com", "password": "secret1234"}
+    )
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            await register_customer(payload=payload, repo=fake)
+        assert exc.value.status_code == 409
+
+    assert fake.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_register_storage_error_is_not_a_conflict() -> None:
+    """Non-duplicate storage failures should not be reported as "already exists".
+
+    Scenario:
+        - Repository create raises a generic database error.
+
+    Expected behavior:
+        - The error propagates (server error) instead of a 409.
+        - The (name, email) pair is not remembered as a conflict.
+    """
+    from pymongo.errors import ServerSelectionTimeoutError
+
+    from app.api import users
+
+    class _DownRepo(_RepoFake):
+        async def create(self, user):
+            raise ServerSelectionTimeoutError("no servers")
+
+    users._register_conflicts.clear()
+    payload = RegisterUserIn.model_validate(
+        {"name": "dave123", "email_address": "dave@example.com", "password": "secret1234"}
+    )
+
+    with pytest.raises(ServerSelectionTimeoutError):
+        await register_customer(payload=payload, repo=_DownRepo())
+
+    assert ("dave123", "dave@example.com") not in users._register_conflicts